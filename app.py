@@ -1,30 +1,30 @@
 """Streamlit UI for Evernote to XWiki extraction tool."""
 
+from __future__ import annotations
+
+import hashlib
 import json
 import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
 import streamlit as st
-from streamlit_file_browser import st_file_browser
 
 # Handle imports - add parent to path for package imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from Evernote_Extractor.converter import convert_note
 from Evernote_Extractor.database import ImportDatabase, ImportStatus
-from Evernote_Extractor.enex_parser import build_enex_inventory, count_notes_in_enex, parse_enex_directory, parse_enex_file
-from Evernote_Extractor.progress import generate_note_identifier
-from Evernote_Extractor.xwiki_client import XWikiClient
-from Evernote_Extractor.evernote_api import (
-    EvernoteClient,
-    EvernoteCredentials,
-    EvernoteOAuth,
-    load_token,
-    save_token,
-    delete_token,
-)
+
+# Page-specific modules (converter, enex_parser, xwiki_client, evernote_api,
+# streamlit_file_browser) are imported inside the render/run functions that
+# use them, so a session only pays the import cost of the page it visits.
 
 # Page config
 st.set_page_config(
@@ -34,8 +34,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for professional styling
-st.markdown("""
+# Custom CSS for professional styling. Kept in a module-level constant so the
+# string is built once per process; reruns only re-send the cached HTML.
+_CSS_HTML = """
 <style>
     /* Import Google Font */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
@@ -473,35 +474,158 @@ st.markdown("""
         color: #854d0e;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _get_css_html() -> str:
+    """Return the app CSS, built once per server process."""
+    return _CSS_HTML
+
+
+def _inject_css() -> None:
+    """Inject the custom CSS into the page."""
+    st.markdown(_get_css_html(), unsafe_allow_html=True)
+
+# Application data directory, computed once (Path.home() re-reads the
+# environment on every call).
+APP_DIR = Path.home() / ".evernote_extractor"
 
 # Config file path
-CONFIG_PATH = Path.home() / ".evernote_extractor" / "config.json"
+CONFIG_PATH = APP_DIR / "config.json"
+
+# Use orjson for config (de)serialization when available; it parses and
+# serializes bytes directly and is considerably faster than stdlib json.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+@st.cache_data
+def _load_config_cached(mtime: float, size: int) -> dict:
+    """Read and parse the config file, cached on its mtime and size."""
+    try:
+        return _json_loads(CONFIG_PATH.read_bytes())
+    except (ValueError, IOError):
+        return {}
 
 
 def load_config() -> dict:
-    """Load saved configuration."""
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    """Load saved configuration.
+
+    The JSON parse is cached on the file's (mtime, size), so reruns only
+    pay a single stat() until the file actually changes.
+    """
+    try:
+        stat = CONFIG_PATH.stat()
+    except OSError:
+        return {}
+    return _load_config_cached(stat.st_mtime, stat.st_size)
 
 
 def save_config(config: dict) -> None:
-    """Save configuration to file."""
+    """Save configuration to file.
+
+    No-op when nothing changed (users re-click Save with identical
+    values), and writes go through a temp file + os.replace so a crash
+    mid-write can never leave a truncated config behind.
+    """
+    if config == load_config():
+        return
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+    tmp_path.write_bytes(_json_dumps(config))
+    os.replace(tmp_path, CONFIG_PATH)
+    # Drop cached parses immediately: on coarse-mtime filesystems a quick
+    # save-then-read could otherwise return the pre-save contents.
+    _load_config_cached.clear()
+
+
+def _enex_fingerprint(source: Path) -> tuple:
+    """Cache key capturing which ENEX files exist plus their mtimes/sizes."""
+    if source.is_file():
+        stat = source.stat()
+        return ((str(source), stat.st_mtime, stat.st_size),)
+    return tuple(
+        (str(p), p.stat().st_mtime, p.stat().st_size)
+        for p in sorted(source.rglob("*.enex"))
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _path_exists(path: str) -> bool:
+    """Stat a path at most once per 5 s across reruns.
+
+    Source-path validation runs on every rerun (each keystroke or checkbox
+    toggle); on network mounts the repeated stat calls are noticeable.
+    """
+    return Path(path).exists()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _validate_source(source_path: str, is_single_file: bool) -> tuple[bool, list[str]]:
+    """Validate the source path, cached so typing elsewhere skips the stat.
+
+    Credential checks stay at the call site; they touch no filesystem.
+    """
+    if not source_path:
+        return False, ["Please enter a source path"]
+    if len(source_path) > 4096 or not _path_exists(source_path):
+        return False, [f"Path does not exist: {source_path}"]
+    if is_single_file and not source_path.endswith(".enex"):
+        return False, ["Single file must be an .enex file"]
+    return True, []
+
+
+@st.cache_data(show_spinner=False)
+def _cached_enex_inventory(source_path: str, fingerprint: tuple) -> tuple[dict, int]:
+    """Build the ENEX inventory, cached until any source file changes.
+
+    Reruns triggered by unrelated widget changes skip the directory
+    re-scan entirely; the fingerprint invalidates the cache when files
+    are added, removed or edited.
+    """
+    from Evernote_Extractor.enex_parser import build_enex_inventory
+
+    return build_enex_inventory(source_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_xwiki_client(wiki_url: str, username: str, password: str, rate_limit: float = 0.5):
+    """Get or create an XWiki client for the given connection settings.
+
+    Cached with st.cache_resource so repeat imports and test buttons reuse
+    the same pooled session (and its warm TLS connections) instead of
+    re-handshaking on every button press.
+    """
+    from Evernote_Extractor.xwiki_client import XWikiClient
+
+    return XWikiClient(
+        wiki_url=wiki_url,
+        username=username,
+        password=password,
+        rate_limit_delay=rate_limit,
+    )
 
 
 # Initialize database
 @st.cache_resource
 def get_database():
     """Get or create database connection."""
-    db_path = Path.home() / ".evernote_extractor" / "imports.db"
+    db_path = APP_DIR / "imports.db"
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return ImportDatabase(db_path)
 
@@ -546,6 +670,23 @@ def render_metric_card(label: str, value: str | int, color_class: str = ""):
     """, unsafe_allow_html=True)
 
 
+def render_metric_row(cards: list[tuple[str, str | int, str]]):
+    """Render a row of metric cards as a single markdown element.
+
+    Takes (label, value, color_class) tuples and emits one fused HTML
+    block instead of one st.markdown call per card, so a row of N
+    metrics costs one ForwardMsg rather than N.
+    """
+    html = '<div class="quick-stats">' + "".join(
+        f'<div class="quick-stat">'
+        f'<div class="metric-value{" " + color_class if color_class else ""}">{value}</div>'
+        f'<div class="metric-label">{label}</div>'
+        f'</div>'
+        for label, value, color_class in cards
+    ) + "</div>"
+    st.markdown(html, unsafe_allow_html=True)
+
+
 def render_footer():
     """Render the application footer."""
     st.markdown("""
@@ -564,6 +705,8 @@ def render_path_chooser(label: str, default_value: str, key_prefix: str, help_te
 
     Returns the selected path string.
     """
+    from streamlit_file_browser import st_file_browser
+
     # Determine the session state key for the chosen path
     state_key = f"{key_prefix}_chosen_path"
 
@@ -583,7 +726,7 @@ def render_path_chooser(label: str, default_value: str, key_prefix: str, help_te
         # Let the user set where the browser starts
         browse_root_key = f"{key_prefix}_browse_root"
         default_root = str(Path.home())
-        if source_path and Path(source_path).exists():
+        if source_path and _path_exists(source_path):
             default_root = str(Path(source_path).parent) if Path(source_path).is_file() else source_path
 
         browse_root = st.text_input(
@@ -622,6 +765,8 @@ def render_path_chooser(label: str, default_value: str, key_prefix: str, help_te
 
 def main():
     """Main application."""
+    _inject_css()
+
     db = get_database()
 
     # Sidebar
@@ -662,8 +807,58 @@ def main():
     render_footer()
 
 
+@st.cache_resource
+def get_evernote_client(token: str, sandbox: bool) -> EvernoteClient:
+    """Get or create an Evernote client for the given token.
+
+    Cached with st.cache_resource so the underlying SDK client (and its
+    note/user store connections) is reused across reruns instead of being
+    re-initialized on every widget interaction.
+    """
+    from Evernote_Extractor.evernote_api import EvernoteClient
+
+    return EvernoteClient(token, sandbox=sandbox)
+
+
+@st.cache_data(show_spinner=False)
+def _notebook_grid_rows(notebook_key: tuple) -> list[dict]:
+    """Build the notebook grid rows, grouped by stack and sorted once.
+
+    Keyed on a tuple of (guid, stack, name, note_count) per notebook, so
+    the grouping and sort only run when the notebook list itself changes
+    rather than on every rerun.
+    """
+    return [
+        {"Stack": stack or "", "Name": name, "Notes": count, "guid": guid}
+        for guid, stack, name, count in sorted(
+            notebook_key, key=lambda t: (t[1] or "", t[2])
+        )
+    ]
+
+
+@st.cache_data(ttl=300, show_spinner="Loading notebooks...")
+def _cached_list_notebooks(token_hash: str, sandbox: bool) -> list:
+    """List Evernote notebooks, cached for 5 minutes per token.
+
+    Keyed on a hash of the token (not the raw token) so the secret never
+    lands in the cache key while reruns still hit the cache.
+    """
+    from Evernote_Extractor.evernote_api import load_token
+
+    client = get_evernote_client(load_token(), sandbox)
+    return client.list_notebooks()
+
+
 def render_evernote_direct_page(db: ImportDatabase):
     """Render the direct Evernote import page."""
+    from Evernote_Extractor.evernote_api import (
+        EvernoteCredentials,
+        EvernoteOAuth,
+        load_token,
+        save_token,
+        delete_token,
+    )
+
     render_main_header(
         "Import from Evernote",
         "Connect directly to your Evernote account and import notes to XWiki"
@@ -681,31 +876,32 @@ def render_evernote_direct_page(db: ImportDatabase):
         </div>
         """, unsafe_allow_html=True)
 
-        col1, col2 = st.columns(2)
-        with col1:
-            consumer_key = st.text_input(
-                "Consumer Key",
-                value=config.get("evernote_consumer_key", ""),
-                help="Your Evernote API Consumer Key",
-            )
-        with col2:
-            consumer_secret = st.text_input(
-                "Consumer Secret",
-                value=config.get("evernote_consumer_secret", ""),
-                type="password",
-                help="Your Evernote API Consumer Secret",
-            )
+        # Inside a form, typing in these fields does not rerun the script;
+        # values are only delivered (and the page re-executed) on submit.
+        # Only the Save handler consumes them, so batching is safe here.
+        with st.form("evernote_api_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                consumer_key = st.text_input(
+                    "Consumer Key",
+                    value=config.get("evernote_consumer_key", ""),
+                    help="Your Evernote API Consumer Key",
+                )
+            with col2:
+                consumer_secret = st.text_input(
+                    "Consumer Secret",
+                    value=config.get("evernote_consumer_secret", ""),
+                    type="password",
+                    help="Your Evernote API Consumer Secret",
+                )
 
-        use_sandbox = st.checkbox(
-            "Use Sandbox (for testing)",
-            value=config.get("evernote_sandbox", False),
-            help="Use Evernote's sandbox environment for testing",
-        )
+            use_sandbox = st.checkbox(
+                "Use Sandbox (for testing)",
+                value=config.get("evernote_sandbox", False),
+                help="Use Evernote's sandbox environment for testing",
+            )
 
-        st.markdown("<br>", unsafe_allow_html=True)
-        col1, col2, col3 = st.columns([1, 1, 2])
-        with col1:
-            if st.button("💾  Save API Settings", type="secondary", use_container_width=True):
+            if st.form_submit_button("💾  Save API Settings", type="secondary"):
                 config["evernote_consumer_key"] = consumer_key
                 config["evernote_consumer_secret"] = consumer_secret
                 config["evernote_sandbox"] = use_sandbox
@@ -777,9 +973,9 @@ def render_evernote_direct_page(db: ImportDatabase):
             if st.button("🔄  Test Connection", type="secondary"):
                 with st.spinner("Testing connection..."):
                     try:
-                        client = EvernoteClient(
+                        client = get_evernote_client(
                             existing_token,
-                            sandbox=config.get("evernote_sandbox", False),
+                            config.get("evernote_sandbox", False),
                         )
                         user_info = client.get_user_info()
                         if "error" in user_info:
@@ -795,45 +991,65 @@ def render_evernote_direct_page(db: ImportDatabase):
         render_section_header("Select Notebooks", "📚", "Choose which notebooks to import to XWiki")
 
         try:
-            client = EvernoteClient(
+            client = get_evernote_client(
                 existing_token,
-                sandbox=config.get("evernote_sandbox", False),
+                config.get("evernote_sandbox", False),
             )
 
-            with st.spinner("Loading notebooks..."):
-                notebooks = client.list_notebooks()
+            token_hash = hashlib.sha1(existing_token.encode()).hexdigest()
+            notebooks = _cached_list_notebooks(
+                token_hash,
+                config.get("evernote_sandbox", False),
+            )
 
             if not notebooks:
                 st.warning("No notebooks found in your Evernote account.")
             else:
-                # Group by stack
-                stacks: dict[str, list] = {"(No Stack)": []}
-                for nb in notebooks:
-                    stack_name = nb.stack or "(No Stack)"
-                    if stack_name not in stacks:
-                        stacks[stack_name] = []
-                    stacks[stack_name].append(nb)
-
-                # Display notebooks with checkboxes
+                # Single selection grid instead of one checkbox widget per
+                # notebook: the data editor virtualizes rendering, so the
+                # per-rerun cost is bounded by the viewport, not the
+                # notebook count.
                 st.write(f"Found {len(notebooks)} notebooks:")
 
-                selected_notebooks = []
+                # Selections live in session state keyed by guid, so they
+                # survive grid rebuilds when the cached notebook list
+                # refreshes.
+                selected_guids: set[str] = st.session_state.setdefault(
+                    "selected_notebook_guids", set()
+                )
 
-                for stack_name, stack_notebooks in sorted(stacks.items()):
-                    if stack_name != "(No Stack)":
-                        st.markdown(f"**{stack_name}/**")
+                nb_by_guid = {nb.guid: nb for nb in notebooks}
+                grid = pd.DataFrame(
+                    _notebook_grid_rows(
+                        tuple(
+                            (nb.guid, nb.stack, nb.name, nb.note_count)
+                            for nb in notebooks
+                        )
+                    )
+                )
+                grid.insert(0, "Select", grid["guid"].isin(selected_guids))
+
+                edited = st.data_editor(
+                    grid,
+                    column_config={
+                        "Select": st.column_config.CheckboxColumn("Select"),
+                        "guid": None,
+                    },
+                    disabled=["Stack", "Name", "Notes", "guid"],
+                    hide_index=True,
+                    use_container_width=True,
+                    key="notebook_grid",
+                )
 
-                    for nb in stack_notebooks:
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            prefix = "    " if stack_name != "(No Stack)" else ""
-                            if st.checkbox(
-                                f"{prefix}{nb.name} ({nb.note_count} notes)",
-                                key=f"nb_{nb.guid}",
-                            ):
-                                selected_notebooks.append(nb)
-                        with col2:
-                            st.caption(f"{nb.note_count} notes")
+                selected_mask = edited["Select"]
+                selected_guids = set(edited.loc[selected_mask, "guid"])
+                st.session_state["selected_notebook_guids"] = selected_guids
+                selected_notebooks = [
+                    nb_by_guid[guid] for guid in selected_guids if guid in nb_by_guid
+                ]
+                # One vectorized reduction over the grid instead of a Python
+                # loop over notebook objects.
+                selected_total_notes = int(edited.loc[selected_mask, "Notes"].sum())
 
                 # Import options
                 st.markdown("---")
@@ -892,6 +1108,7 @@ def render_evernote_direct_page(db: ImportDatabase):
                         skip_existing_db=skip_existing_db,
                         skip_existing_xwiki=skip_existing_xwiki,
                         rate_limit=rate_limit,
+                        total_notes=selected_total_notes,
                     )
 
         except Exception as e:
@@ -933,6 +1150,268 @@ def render_evernote_direct_page(db: ImportDatabase):
                     st.error(f"Authentication error: {e}")
 
 
+def _page_content_digest(page) -> bytes:
+    """Digest of a converted page's body and attachment payloads.
+
+    blake2b is the fastest hash in hashlib's C core and 16 bytes is
+    plenty for same-run dedup. Attachments are folded in sorted by
+    filename so two notes with identical text but different files never
+    collide.
+    """
+    digest = hashlib.blake2b(page.content.encode(), digest_size=16)
+    for attachment in sorted(page.attachments, key=lambda a: a.filename):
+        digest.update(attachment.data)
+    return digest.digest()
+
+
+def _evernote_import_worker(
+    db: ImportDatabase,
+    evernote_client: EvernoteClient,
+    selected_notebooks: list,
+    xwiki_client: XWikiClient,
+    session_id: int,
+    wiki_url: str,
+    target_space: str,
+    skip_existing_db: bool,
+    skip_existing_xwiki: bool,
+    total_notes: int,
+    events: queue.Queue,
+    done: threading.Event,
+) -> None:
+    """Run the Evernote import loop on a background thread.
+
+    All download/convert/upload/database work happens here so the Streamlit
+    script thread stays free to repaint the UI. Must not touch ``st`` -
+    progress is reported through ``events`` as ("log", message),
+    ("progress", fraction, text) and ("counts", completed, failed, skipped)
+    tuples.
+    """
+    from Evernote_Extractor.converter import convert_note, preview_page_identity
+    from Evernote_Extractor.progress import generate_note_identifier
+
+    completed = 0
+    failed = 0
+    skipped = 0
+    # Status updates are buffered and written in a single executemany
+    # transaction every N notes (together with the session counters)
+    # instead of one fsynced commit per note.
+    pending_updates: list[tuple] = []
+    _DB_FLUSH_EVERY = 50
+    _UPLOAD_WORKERS = 8
+    upload_pool = ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS, thread_name_prefix="evernote-upload")
+    in_flight: set = set()
+
+    def _flush_status() -> None:
+        db.flush_progress(session_id, completed, failed, skipped, pending_updates)
+        pending_updates.clear()
+
+    def _queue_status(
+        record_id: int,
+        status: ImportStatus,
+        page_url: str | None = None,
+        error_message: str | None = None,
+        attachments_uploaded: int = 0,
+    ) -> None:
+        pending_updates.append(
+            (record_id, status, page_url, error_message, attachments_uploaded)
+        )
+        if len(pending_updates) >= _DB_FLUSH_EVERY:
+            _flush_status()
+
+    try:
+        # Prefetch skip-check state once instead of issuing one database query
+        # and one XWiki request per note.
+        imported_ids = db.get_imported_identifiers(wiki_url) if skip_existing_db else set()
+        existing_pages: dict[str, set[str] | None] = {}
+        existing_pages_lock = threading.Lock()
+
+        # Same-run content dedup, mirroring the ENEX path: re-synced
+        # notebooks often contain byte-identical notes under new titles.
+        # Recorded only after a successful upload so a failed first copy
+        # never suppresses its twin.
+        seen_content: dict[bytes, str] = {}
+        seen_content_lock = threading.Lock()
+
+        def _page_known(space: str, page_name: str) -> bool:
+            """Existence check against one bulk listing per space.
+
+            Falls back to a per-page request when the listing endpoint is
+            unavailable. Called from upload threads, hence the lock.
+            """
+            with existing_pages_lock:
+                if space not in existing_pages:
+                    existing_pages[space] = xwiki_client.list_existing_pages(space)
+                known_pages = existing_pages[space]
+            if known_pages is not None:
+                return page_name in known_pages
+            return xwiki_client.page_exists(space, page_name)
+
+        def _convert_and_upload(note, record_id: int, note_id: str) -> tuple:
+            """Convert and upload one note on a pool thread.
+
+            No database or events access here; results are folded in on
+            this worker thread by _handle_result so SQLite writes and the
+            event stream stay single-threaded.
+            """
+            try:
+                # Identity is derivable from title + notebook alone, so the
+                # existence check runs before paying for full conversion.
+                if skip_existing_xwiki:
+                    space, page_name = preview_page_identity(note, target_space)
+                    if _page_known(space, page_name):
+                        return (record_id, note_id, "skipped_xwiki", note.title, None, None, 0)
+                page = convert_note(note, target_space)
+
+                content_digest = _page_content_digest(page)
+                with seen_content_lock:
+                    duplicate_of = seen_content.get(content_digest)
+                if duplicate_of is not None:
+                    return (record_id, note_id, "duplicate", note.title, duplicate_of, None, 0)
+
+                result = xwiki_client.create_or_update_page(page)
+                if result.success:
+                    with seen_content_lock:
+                        seen_content.setdefault(content_digest, result.page_url or "")
+                    return (
+                        record_id,
+                        note_id,
+                        "completed",
+                        note.title,
+                        result.page_url,
+                        None,
+                        result.attachments_uploaded,
+                    )
+                return (record_id, note_id, "failed", note.title, None, result.error, 0)
+            except Exception as e:
+                return (record_id, note_id, "failed", note.title, None, str(e), 0)
+
+        def _handle_result(result: tuple) -> None:
+            nonlocal completed, failed, skipped
+            record_id, note_id, outcome, title, page_url, error, attachments_uploaded = result
+            if outcome == "completed":
+                _queue_status(
+                    record_id,
+                    ImportStatus.COMPLETED,
+                    page_url=page_url,
+                    attachments_uploaded=attachments_uploaded,
+                )
+                # Keep the prefetched set consistent with this session so a
+                # note repeated across notebooks is skipped, not re-uploaded.
+                imported_ids.add(note_id)
+                completed += 1
+                events.put(("log", f"  Imported: {title}"))
+            elif outcome == "skipped_xwiki":
+                _queue_status(record_id, ImportStatus.SKIPPED, error_message="Already exists in XWiki")
+                skipped += 1
+                events.put(("log", f"  Skipped (exists in XWiki): {title}"))
+            elif outcome == "duplicate":
+                _queue_status(
+                    record_id,
+                    ImportStatus.SKIPPED,
+                    page_url=page_url or None,
+                    error_message="Duplicate content (already uploaded this session)",
+                )
+                skipped += 1
+                events.put(("log", f"  Skipped (duplicate content): {title}"))
+            else:
+                _queue_status(record_id, ImportStatus.FAILED, error_message=error)
+                failed += 1
+                events.put(("log", f"  Failed: {title} - {error}"))
+
+            events.put(("counts", completed, failed, skipped))
+
+        # Hoisted out of the per-note loop: the divisor never changes.
+        inv_total = 1.0 / total_notes if total_notes else 0.0
+
+        # Process each notebook
+        for notebook in selected_notebooks:
+            events.put(("log", f"Importing notebook: {notebook.name}"))
+
+            # Build the notebook path for XWiki space
+            if notebook.stack:
+                notebook_path = f"{notebook.stack}.{notebook.name}".replace(" ", "")
+            else:
+                notebook_path = notebook.name.replace(" ", "")
+
+            # Built once per notebook instead of once per record
+            notebook_source = f"evernote://{notebook.name}"
+
+            # List metadata first: identifiers key on title + created, so the
+            # database skip check runs before any full note download and
+            # already-imported notes cost one metadata row, not a download.
+            note_metas = evernote_client.list_note_metadata(notebook.guid)
+
+            for meta in note_metas:
+                processed = completed + failed + skipped
+                events.put(
+                    ("progress", processed * inv_total, f"Processing: {meta.title[:50]}...")
+                )
+
+                note_id = generate_note_identifier(meta.title, meta.created)
+
+                # Check if already imported (database check - fast)
+                if skip_existing_db and note_id in imported_ids:
+                    record_id = db.create_record(
+                        session_id=session_id,
+                        source_file=notebook_source,
+                        note_title=meta.title,
+                        note_identifier=note_id,
+                        wiki_url=wiki_url,
+                        target_space=target_space,
+                    )
+                    _queue_status(record_id, ImportStatus.SKIPPED, error_message="Already imported (database)")
+                    skipped += 1
+                    events.put(("log", f"  Skipped (in database): {meta.title}"))
+                    events.put(("counts", completed, failed, skipped))
+                    continue
+
+                # Hydrate the full note only for survivors
+                note = evernote_client.get_note(meta, notebook_path)
+
+                # Create record
+                record_id = db.create_record(
+                    session_id=session_id,
+                    source_file=notebook_source,
+                    note_title=meta.title,
+                    note_identifier=note_id,
+                    wiki_url=wiki_url,
+                    target_space=target_space,
+                    attachments_count=len(note.attachments) if note else 0,
+                )
+
+                if note is None:
+                    _queue_status(record_id, ImportStatus.FAILED, error_message="Download failed")
+                    failed += 1
+                    events.put(("log", f"  Failed: {meta.title} - download failed"))
+                    events.put(("counts", completed, failed, skipped))
+                    continue
+
+                # Convert + upload runs on the pool so the next Evernote
+                # download overlaps with in-flight XWiki round-trips; the
+                # in-flight window stays bounded to cap buffered payloads.
+                in_flight.add(upload_pool.submit(_convert_and_upload, note, record_id, note_id))
+                if len(in_flight) >= _UPLOAD_WORKERS * 2:
+                    done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done_futures:
+                        _handle_result(future.result())
+
+        # Drain remaining uploads
+        while in_flight:
+            done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                _handle_result(future.result())
+
+    except Exception as e:
+        failed += 1
+        events.put(("log", f"Import aborted: {e}"))
+        events.put(("counts", completed, failed, skipped))
+    finally:
+        upload_pool.shutdown(wait=True)
+        # Authoritative final flush regardless of how the loop exited.
+        _flush_status()
+        done.set()
+
+
 def run_evernote_import(
     db: ImportDatabase,
     evernote_client: EvernoteClient,
@@ -944,10 +1423,13 @@ def run_evernote_import(
     skip_existing_db: bool,
     skip_existing_xwiki: bool,
     rate_limit: float,
+    total_notes: int | None = None,
 ):
     """Run import from Evernote to XWiki."""
-    # Calculate total notes
-    total_notes = sum(nb.note_count for nb in selected_notebooks)
+    # Total comes pre-computed from the notebook grid; fall back to summing
+    # the notebook objects when called without it.
+    if total_notes is None:
+        total_notes = sum(nb.note_count for nb in selected_notebooks)
 
     if total_notes == 0:
         st.warning("Selected notebooks contain no notes.")
@@ -964,12 +1446,7 @@ def run_evernote_import(
     )
 
     # Initialize XWiki client
-    xwiki_client = XWikiClient(
-        wiki_url=wiki_url,
-        username=username,
-        password=password,
-        rate_limit_delay=rate_limit,
-    )
+    xwiki_client = get_xwiki_client(wiki_url, username, password, rate_limit)
 
     # Test XWiki connection
     with st.spinner("Connecting to XWiki..."):
@@ -983,110 +1460,98 @@ def run_evernote_import(
     # Progress tracking
     progress_bar = st.progress(0, text="Starting import...")
     status_container = st.empty()
-    log_container = st.container()
+
+    # Bounded ring-buffer log rendered into a single placeholder: keeps the
+    # DOM at O(buffer size) instead of growing one element per note.
+    log_placeholder = st.empty()
+    log_buffer: deque[str] = deque(maxlen=200)
+
+    _last_log = {"text": None}
+
+    def flush_log() -> None:
+        # Skip the websocket push when the visible tail has not changed
+        # (drain passes that carried only progress/count events).
+        text = "\n".join(log_buffer)
+        if text != _last_log["text"]:
+            log_placeholder.code(text, language=None)
+            _last_log["text"] = text
+
+    # Run the import on a worker thread so downloads/uploads do not block the
+    # Streamlit script thread; this loop just drains events and repaints.
+    events: queue.Queue = queue.Queue()
+    done = threading.Event()
+    worker = threading.Thread(
+        target=_evernote_import_worker,
+        args=(
+            db,
+            evernote_client,
+            selected_notebooks,
+            xwiki_client,
+            session_id,
+            wiki_url,
+            target_space,
+            skip_existing_db,
+            skip_existing_xwiki,
+            total_notes,
+            events,
+            done,
+        ),
+        daemon=True,
+    )
+    worker.start()
 
     completed = 0
     failed = 0
     skipped = 0
-    processed = 0
-
-    # Process each notebook
-    for notebook in selected_notebooks:
-        with log_container:
-            st.markdown(f"**Importing notebook: {notebook.name}**")
 
-        # Build the notebook path for XWiki space
-        if notebook.stack:
-            notebook_path = f"{notebook.stack}.{notebook.name}".replace(" ", "")
-        else:
-            notebook_path = notebook.name.replace(" ", "")
-
-        # Download and import notes from this notebook
-        def progress_callback(current: int, total: int, title: str):
-            nonlocal processed
-            processed = completed + failed + skipped + current
-            progress = processed / total_notes if total_notes > 0 else 0
-            progress_bar.progress(progress, text=f"Processing: {title[:50]}...")
-
-        for note in evernote_client.get_notes_from_notebook(
-            notebook.guid,
-            notebook_name=notebook_path,
-            progress_callback=progress_callback,
-        ):
-            from Evernote_Extractor.progress import generate_note_identifier
-
-            note_id = generate_note_identifier(note.title, note.created)
-
-            # Create record
-            record_id = db.create_record(
-                session_id=session_id,
-                source_file=f"evernote://{notebook.name}",
-                note_title=note.title,
-                note_identifier=note_id,
-                wiki_url=wiki_url,
-                target_space=target_space,
-                attachments_count=len(note.attachments),
-            )
-
-            # Check if already imported (database check - fast)
-            if skip_existing_db and db.is_note_imported(note_id, wiki_url):
-                db.update_record_status(record_id, ImportStatus.SKIPPED, error_message="Already imported (database)")
-                skipped += 1
-                with log_container:
-                    st.text(f"  Skipped (in database): {note.title}")
-                continue
-
-            # Convert and upload
+    # Change detection for UI repaints: each progress/status push is a
+    # websocket message, so only repaint when the integer percentage (or
+    # the counts) actually moved, or at most every 200 ms for the text.
+    last_pct = -1
+    last_progress_push = 0.0
+    last_counts = (-1, -1, -1)
+
+    while not (done.is_set() and events.empty()):
+        drained = False
+        pending_progress: tuple[float, str] | None = None
+        while True:
             try:
-                page = convert_note(note, target_space)
-
-                # Check if page exists in XWiki (slower - requires API call)
-                if skip_existing_xwiki and xwiki_client.page_exists(page.space, page.page_name):
-                    db.update_record_status(record_id, ImportStatus.SKIPPED, error_message="Already exists in XWiki")
-                    skipped += 1
-                    with log_container:
-                        st.text(f"  Skipped (exists in XWiki): {note.title}")
-                    continue
-
-                result = xwiki_client.create_or_update_page(page)
-
-                if result.success:
-                    db.update_record_status(
-                        record_id,
-                        ImportStatus.COMPLETED,
-                        page_url=result.page_url,
-                        attachments_uploaded=result.attachments_uploaded,
-                    )
-                    completed += 1
-                    with log_container:
-                        st.text(f"  Imported: {note.title}")
-                else:
-                    db.update_record_status(
-                        record_id,
-                        ImportStatus.FAILED,
-                        error_message=result.error,
-                    )
-                    failed += 1
-                    with log_container:
-                        st.text(f"  Failed: {note.title} - {result.error}")
-
-            except Exception as e:
-                db.update_record_status(
-                    record_id,
-                    ImportStatus.FAILED,
-                    error_message=str(e),
-                )
-                failed += 1
-                with log_container:
-                    st.text(f"  Error: {note.title} - {e}")
-
-            # Update session counts
-            db.update_session_counts(session_id, completed, failed, skipped)
-
-            # Update status
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            drained = True
+            kind = event[0]
+            if kind == "log":
+                log_buffer.append(event[1])
+            elif kind == "progress":
+                # Keep only the newest progress event from this drain pass
+                pending_progress = (event[1], event[2])
+            elif kind == "counts":
+                completed, failed, skipped = event[1], event[2], event[3]
+
+        if pending_progress is not None:
+            fraction, text = pending_progress
+            pct = int(fraction * 100)
+            now = time.monotonic()
+            # Coalesced throttle: one websocket push per visible percent
+            # step, with a 5 Hz floor so the note title keeps scrolling.
+            if pct != last_pct or now - last_progress_push > 0.2:
+                progress_bar.progress(fraction, text=text)
+                last_pct = pct
+                last_progress_push = now
+
+        if (completed, failed, skipped) != last_counts:
             status_container.markdown(
                 f"**Progress:** {completed} completed | {failed} failed | {skipped} skipped"
             )
+            last_counts = (completed, failed, skipped)
+
+        if drained:
+            flush_log()
+        time.sleep(0.1)
+
+    worker.join()
+    flush_log()
 
     # Finish session
     final_status = ImportStatus.COMPLETED if failed == 0 else ImportStatus.FAILED
@@ -1175,11 +1640,7 @@ def render_import_page(db: ImportDatabase):
                 else:
                     with st.spinner("Testing connection..."):
                         try:
-                            client = XWikiClient(
-                                wiki_url=wiki_url,
-                                username=username,
-                                password=password,
-                            )
+                            client = get_xwiki_client(wiki_url, username, password)
                             result = client.test_connection_detailed()
 
                             if result["success"]:
@@ -1204,11 +1665,7 @@ def render_import_page(db: ImportDatabase):
                 else:
                     with st.spinner("Testing page creation..."):
                         try:
-                            client = XWikiClient(
-                                wiki_url=wiki_url,
-                                username=username,
-                                password=password,
-                            )
+                            client = get_xwiki_client(wiki_url, username, password)
                             result = client.test_page_creation(target_space, "EvernoteImporterTest")
 
                             if result.get("success"):
@@ -1233,11 +1690,7 @@ Response: {result.get('response', result.get('error'))}
                 else:
                     with st.spinner("Checking authentication..."):
                         try:
-                            client = XWikiClient(
-                                wiki_url=wiki_url,
-                                username=username,
-                                password=password,
-                            )
+                            client = get_xwiki_client(wiki_url, username, password)
                             result = client.check_user_info()
                             st.code(f"""
 REST Root: {result.get('rest_root')}
@@ -1297,22 +1750,11 @@ Auth header present: True
             help="Check XWiki for each note before importing (slower)",
         )
 
-    # Validation
-    can_import = True
-    validation_messages = []
-
+    # Validation. The path checks are cached on (path, type) so reruns
+    # from unrelated widgets skip the filesystem entirely.
     # Adjust source_type check for new format with emoji
     is_single_file = "Single" in source_type
-
-    if not source_path:
-        can_import = False
-        validation_messages.append("Please enter a source path")
-    elif not Path(source_path).exists():
-        can_import = False
-        validation_messages.append(f"Path does not exist: {source_path}")
-    elif is_single_file and not source_path.endswith(".enex"):
-        can_import = False
-        validation_messages.append("Single file must be an .enex file")
+    can_import, validation_messages = _validate_source(source_path, is_single_file)
 
     if not wiki_url and not dry_run:
         can_import = False
@@ -1360,7 +1802,9 @@ Auth header present: True
     if scan_clicked and can_import:
         with st.spinner("Scanning ENEX files..."):
             try:
-                inventory, grand_total = build_enex_inventory(source_path)
+                inventory, grand_total = _cached_enex_inventory(
+                    source_path, _enex_fingerprint(Path(source_path))
+                )
                 st.session_state["import_manifest"] = inventory
                 st.session_state["import_manifest_total"] = grand_total
                 st.session_state["import_manifest_source"] = source_path
@@ -1394,11 +1838,17 @@ Auth header present: True
             files_in_folder = folders[folder_name]
             folder_note_count = sum(len(s) for _, s in files_in_folder)
             with st.expander(f"📂 {folder_name} — {len(files_in_folder)} file(s), {folder_note_count} notes"):
+                # One markdown widget per folder: a widget per note makes
+                # the browser crawl on large manifests.
+                lines: list[str] = []
                 for file_name, summaries in sorted(files_in_folder, key=lambda x: x[0].casefold()):
-                    st.markdown(f"**{file_name}** ({len(summaries)} notes)")
+                    lines.append(f"**{file_name}** ({len(summaries)} notes)")
+                    lines.append("")
                     for s in summaries:
                         created_str = s["created"].strftime("%Y-%m-%d %H:%M") if s["created"] else "no date"
-                        st.markdown(f"- {s['title']} ({created_str})")
+                        lines.append(f"- {s['title']} ({created_str})")
+                    lines.append("")
+                st.markdown("\n".join(lines))
 
         st.info(f"Review the manifest above, then click **Start Import** to proceed. Total: **{grand_total}** notes.")
 
@@ -1442,47 +1892,44 @@ def run_import(
     total_notes: int | None = None,
 ):
     """Run the import process."""
+    from Evernote_Extractor.converter import convert_note, preview_page_identity
+    from Evernote_Extractor.enex_parser import parse_enex_directory, parse_enex_file
+    from Evernote_Extractor.progress import generate_note_identifier
+
     source = Path(source_path)
 
-    # Count notes if not already provided by manifest
+    # When the caller already counted notes (manifest/grid), use that for
+    # progress. Otherwise make a single streaming pass and size the progress
+    # bar by bytes instead of pre-reading every file just to count.
+    file_sizes: dict[Path, int] = {}
+    total_bytes = 0
     if total_notes is None:
-        with st.spinner("Scanning ENEX files..."):
-            total_notes = 0
-            enex_files = []
-            if source.is_file():
-                total_notes = count_notes_in_enex(source)
-                enex_files = [source]
-            else:
-                enex_files = list(source.rglob("*.enex"))
-                for enex_file in enex_files:
-                    total_notes += count_notes_in_enex(enex_file)
-
-            if len(enex_files) > 1:
-                st.info(f"Found {len(enex_files)} ENEX files in directory tree")
-
-    if total_notes == 0:
+        enex_files = [source] if source.is_file() else sorted(source.rglob("*.enex"))
+        if not enex_files:
+            st.error("No ENEX files found in the specified path.")
+            return
+        file_sizes = {f: f.stat().st_size for f in enex_files}
+        total_bytes = sum(file_sizes.values())
+        if len(enex_files) > 1:
+            st.info(f"Found {len(enex_files)} ENEX files in directory tree")
+    elif total_notes == 0:
         st.error("No notes found in the specified path.")
         return
-
-    st.info(f"Found {total_notes} notes to process")
+    else:
+        st.info(f"Found {total_notes} notes to process")
 
     # Create session in database
     session_id = db.create_session(
         source_path=str(source),
         wiki_url=wiki_url or "dry-run",
         target_space=target_space,
-        total_notes=total_notes,
+        total_notes=total_notes or 0,
     )
 
     # Initialize XWiki client
     client = None
     if not dry_run:
-        client = XWikiClient(
-            wiki_url=wiki_url,
-            username=username,
-            password=password,
-            rate_limit_delay=rate_limit,
-        )
+        client = get_xwiki_client(wiki_url, username, password, rate_limit)
 
         # Test connection
         with st.spinner("Connecting to XWiki..."):
@@ -1493,112 +1940,328 @@ def run_import(
 
         st.success("Connected to XWiki successfully!")
 
-    # Progress tracking
-    progress_bar = st.progress(0, text="Starting import...")
-    status_container = st.empty()
-    log_container = st.container()
+    # Progress tracking. The bar, status line, and log live inside their
+    # own fragment so their deltas are scoped to it: a rerun triggered by
+    # any other widget on the page replays just this region instead of the
+    # whole script output.
+    progress_region: dict = {}
+
+    @st.fragment
+    def _build_progress_region() -> None:
+        progress_region["bar"] = st.progress(0, text="Starting import...")
+        progress_region["status"] = st.empty()
+        # Ring-buffer log rendered into one placeholder, refreshed at most
+        # every 250 ms together with the progress bar and status line; per-note
+        # widget updates otherwise dominate fast (especially dry-run) imports.
+        progress_region["log"] = st.empty()
+
+    _build_progress_region()
+    progress_bar = progress_region["bar"]
+    status_container = progress_region["status"]
+    log_placeholder = progress_region["log"]
+    log_buffer: deque[str] = deque(maxlen=200)
+    last_ui_flush = 0.0
+    # (fraction, processed, title) — kept raw and only formatted into the
+    # progress-bar label when a repaint actually fires, so the hot path
+    # does not build an f-string per note that nobody sees.
+    latest_progress: tuple[float, int, str] = (0.0, 0, "Starting import...")
 
     completed = 0
     failed = 0
     skipped = 0
 
+    last_painted: dict = {"progress": None, "counts": None, "log": None}
+
+    def refresh_ui(force: bool = False) -> None:
+        nonlocal last_ui_flush
+        now = time.monotonic()
+        if not force and now - last_ui_flush < 0.25:
+            return
+        last_ui_flush = now
+
+        # Repaint each widget only when its content actually changed
+        if latest_progress != last_painted["progress"]:
+            fraction, done, title = latest_progress
+            if total_notes:
+                text = f"Processing {done}/{total_notes}: {title[:50]}..."
+            else:
+                text = f"Processing note {done}: {title[:50]}..."
+            progress_bar.progress(fraction, text=text)
+            last_painted["progress"] = latest_progress
+
+        counts = (completed, failed, skipped)
+        if counts != last_painted["counts"]:
+            status_container.markdown(
+                f"**Progress:** {completed} completed | {failed} failed | {skipped} skipped"
+            )
+            last_painted["counts"] = counts
+
+        log_text = "\n".join(log_buffer)
+        if log_text != last_painted["log"]:
+            log_placeholder.code(log_text, language=None)
+            last_painted["log"] = log_text
+
+    # Status updates are buffered and flushed in a single executemany
+    # transaction every N notes instead of one fsynced commit per note.
+    pending_updates: list[tuple] = []
+    _DB_FLUSH_EVERY = 50
+
+    def flush_status() -> None:
+        db.flush_progress(session_id, completed, failed, skipped, pending_updates)
+        pending_updates.clear()
+
+    def queue_status(
+        record_id: int | None,
+        status: ImportStatus,
+        page_url: str | None = None,
+        error_message: str | None = None,
+        attachments_uploaded: int = 0,
+    ) -> None:
+        # Dry runs create no per-note records (record_id is None); results
+        # live in the log and the single session summary row instead.
+        if record_id is None:
+            return
+        pending_updates.append(
+            (record_id, status, page_url, error_message, attachments_uploaded)
+        )
+        if len(pending_updates) >= _DB_FLUSH_EVERY:
+            flush_status()
+
+    # One query for all already-imported identifiers instead of an indexed
+    # SELECT per note inside the loop.
+    already_imported = (
+        db.get_imported_identifiers(wiki_url)
+        if skip_existing_db and not dry_run
+        else set()
+    )
+
     # Get notes iterator
     if source.is_file():
         notes_iter = ((source, note) for note in parse_enex_file(source))
     else:
         notes_iter = parse_enex_directory(source)
 
-    # Process notes
-    for i, (file_path, note) in enumerate(notes_iter):
-        note_id = generate_note_identifier(note.title, note.created)
-
-        # Create record in database
-        record_id = db.create_record(
-            session_id=session_id,
-            source_file=str(file_path),
-            note_title=note.title,
-            note_identifier=note_id,
-            wiki_url=wiki_url or "dry-run",
-            target_space=target_space,
-            attachments_count=len(note.attachments),
-        )
-
-        # Check if already imported (database check - fast)
-        if skip_existing_db and not dry_run and db.is_note_imported(note_id, wiki_url):
-            db.update_record_status(record_id, ImportStatus.SKIPPED, error_message="Already imported (database)")
-            skipped += 1
-            with log_container:
-                st.text(f"⏭️ Skipped (in database): {note.title}")
-            continue
-
-        # Convert note
+    # Convert + upload runs on worker threads (the XWiki client's session
+    # pool and token bucket are thread-safe); database writes and Streamlit
+    # updates stay on this thread, fed by completed futures.
+    _MAX_WORKERS = 8
+
+    # Existence checks hit a per-space bulk listing fetched once and shared
+    # across workers, falling back to a per-page request only if the
+    # listing fails. Saves one HTTP round trip per note. Listings are
+    # seeded from (and written back to) session_state so a re-run shortly
+    # after a tweak skips the fetch too; worker threads cannot touch
+    # session_state, so the handoff happens here on the script thread.
+    _PAGE_CACHE_TTL = 300.0
+    existing_pages: dict[str, set[str] | None] = {}
+    existing_pages_lock = threading.Lock()
+    if skip_existing_xwiki and not dry_run:
+        _cache_now = time.monotonic()
+        for space, (fetched_at, pages) in st.session_state.setdefault(
+            "page_exists_cache", {}
+        ).items():
+            if pages is not None and _cache_now - fetched_at < _PAGE_CACHE_TTL:
+                existing_pages[space] = pages
+
+    # Evernote exports often contain the same note twice (re-syncs, copies
+    # under new titles). Hash converted content and skip re-uploading a body
+    # this session has already pushed; recorded only after a successful
+    # upload so a failed first copy never suppresses its twin.
+    seen_content: dict[bytes, str] = {}
+    seen_content_lock = threading.Lock()
+
+    def _page_known(space: str, page_name: str) -> bool:
+        with existing_pages_lock:
+            if space not in existing_pages:
+                existing_pages[space] = client.list_existing_pages(space)
+            known = existing_pages[space]
+        if known is not None:
+            return page_name in known
+        return client.page_exists(space, page_name)
+
+    def _process_one_note(note, record_id: int | None, note_id: str) -> tuple:
+        """Convert and upload one note. No Streamlit or database calls.
+
+        Conversion runs here in the worker (not on the submitting thread)
+        so CPU-bound ENML parsing overlaps with other workers' network
+        I/O; lxml releases the GIL while parsing. Process-based workers
+        would not help: notes carry multi-megabyte attachment payloads
+        that would be pickled both ways, and conversion may download
+        external images, which is network-bound anyway.
+
+        Returns (record_id, note_id, outcome, title, page_url, error,
+        attachments_uploaded) where outcome is one of "completed",
+        "dry_run", "skipped_xwiki" or "failed".
+        """
         try:
+            # Check if page exists in XWiki (bulk listing per space) before
+            # paying for conversion; identity needs only title + notebook.
+            if skip_existing_xwiki and not dry_run:
+                space, page_name = preview_page_identity(note, target_space)
+                if _page_known(space, page_name):
+                    return (record_id, note_id, "skipped_xwiki", note.title, None, None, 0)
+
             page = convert_note(note, target_space)
 
-            # Check if page exists in XWiki (slower - requires API call)
-            if skip_existing_xwiki and not dry_run and client.page_exists(page.space, page.page_name):
-                db.update_record_status(record_id, ImportStatus.SKIPPED, error_message="Already exists in XWiki")
-                skipped += 1
-                with log_container:
-                    st.text(f"⏭️ Skipped (exists in XWiki): {note.title}")
-                continue
+            content_digest = _page_content_digest(page)
+            if not dry_run:
+                with seen_content_lock:
+                    duplicate_of = seen_content.get(content_digest)
+                if duplicate_of is not None:
+                    return (record_id, note_id, "duplicate", note.title, duplicate_of, None, 0)
 
             if dry_run:
-                db.update_record_status(
+                return (
                     record_id,
-                    ImportStatus.COMPLETED,
-                    page_url=f"[dry-run] {page.space}/{page.page_name}",
+                    note_id,
+                    "dry_run",
+                    note.title,
+                    f"[dry-run] {page.space}/{page.page_name}",
+                    None,
+                    0,
                 )
-                completed += 1
-                with log_container:
-                    st.text(f"✅ [DRY RUN] Would import: {note.title}")
-            else:
-                # Upload to XWiki
-                result = client.create_or_update_page(page)
 
-                if result.success:
-                    db.update_record_status(
-                        record_id,
-                        ImportStatus.COMPLETED,
-                        page_url=result.page_url,
-                        attachments_uploaded=result.attachments_uploaded,
-                    )
-                    completed += 1
-                    with log_container:
-                        st.text(f"✅ Imported: {note.title}")
-                else:
-                    db.update_record_status(
-                        record_id,
-                        ImportStatus.FAILED,
-                        error_message=result.error,
-                    )
-                    failed += 1
-                    with log_container:
-                        st.text(f"❌ Failed: {note.title} - {result.error}")
+            result = client.create_or_update_page(page)
+            if result.success:
+                with seen_content_lock:
+                    seen_content.setdefault(content_digest, result.page_url or "")
+                # Keep the listing consistent with pages created this run.
+                with existing_pages_lock:
+                    known_now = existing_pages.get(page.space)
+                    if known_now is not None:
+                        known_now.add(page.page_name)
+                return (
+                    record_id,
+                    note_id,
+                    "completed",
+                    note.title,
+                    result.page_url,
+                    None,
+                    result.attachments_uploaded,
+                )
+            return (record_id, note_id, "failed", note.title, None, result.error, 0)
 
         except Exception as e:
-            db.update_record_status(
+            return (record_id, note_id, "failed", note.title, None, str(e), 0)
+
+    processed = 0
+    # Multiply by precomputed inverses in the per-note path instead of
+    # dividing by the (constant) totals each time.
+    inv_total = 1.0 / total_notes if total_notes else 0.0
+    inv_bytes = 1.0 / total_bytes if total_bytes else 0.0
+
+    def handle_result(result: tuple) -> None:
+        nonlocal completed, failed, skipped, processed, latest_progress
+        record_id, note_id, outcome, title, page_url, error, attachments_uploaded = result
+
+        if outcome == "skipped_xwiki":
+            queue_status(record_id, ImportStatus.SKIPPED, error_message="Already exists in XWiki")
+            skipped += 1
+            log_buffer.append(f"⏭️ Skipped (exists in XWiki): {title}")
+        elif outcome == "duplicate":
+            queue_status(
+                record_id,
+                ImportStatus.SKIPPED,
+                page_url=page_url or None,
+                error_message="Duplicate content (already uploaded this session)",
+            )
+            skipped += 1
+            log_buffer.append(f"⏭️ Skipped (duplicate content): {title}")
+        elif outcome == "dry_run":
+            queue_status(record_id, ImportStatus.COMPLETED, page_url=page_url)
+            completed += 1
+            log_buffer.append(f"✅ [DRY RUN] Would import: {title}")
+        elif outcome == "completed":
+            queue_status(
                 record_id,
-                ImportStatus.FAILED,
-                error_message=str(e),
+                ImportStatus.COMPLETED,
+                page_url=page_url,
+                attachments_uploaded=attachments_uploaded,
             )
+            # Keep the prefetched set consistent with this session so a note
+            # repeated across files is skipped instead of re-uploaded.
+            already_imported.add(note_id)
+            completed += 1
+            log_buffer.append(f"✅ Imported: {title}")
+        else:
+            queue_status(record_id, ImportStatus.FAILED, error_message=error)
             failed += 1
-            with log_container:
-                st.text(f"❌ Error: {note.title} - {e}")
+            log_buffer.append(f"❌ Failed: {title} - {error}")
 
-        # Update progress
-        progress = (i + 1) / total_notes
-        progress_bar.progress(progress, text=f"Processing {i + 1}/{total_notes}: {note.title[:50]}...")
+        processed += 1
+        if total_notes:
+            progress = min(processed * inv_total, 1.0)
+        else:
+            # Byte-based denominator for the single-pass mode; counts bytes
+            # of files whose notes have all been submitted, so it is coarse
+            # but monotonic.
+            progress = min(bytes_done * inv_bytes, 1.0)
+        latest_progress = (progress, processed, title)
+        refresh_ui()
+
+    # Process notes: submit to the pool with a bounded in-flight window so
+    # parsed notes (which carry attachment data) don't pile up in memory.
+    in_flight: set = set()
+    bytes_done = 0
+    current_file: Path | None = None
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        for file_path, note in notes_iter:
+            if file_path != current_file:
+                if current_file is not None:
+                    bytes_done += file_sizes.get(current_file, 0)
+                current_file = file_path
 
-        # Update session counts
-        db.update_session_counts(session_id, completed, failed, skipped)
+            note_id = generate_note_identifier(note.title, note.created)
 
-        # Update status display
-        status_container.markdown(
-            f"**Progress:** {completed} completed | {failed} failed | {skipped} skipped"
-        )
+            # Create record in database. Dry runs skip the per-note row:
+            # they change nothing in XWiki, so a 10k-note preview would
+            # otherwise pay O(N) inserts for history nobody consults. The
+            # session row still records the aggregate counts at the end.
+            record_id = (
+                None
+                if dry_run
+                else db.create_record(
+                    session_id=session_id,
+                    source_file=str(file_path),
+                    note_title=note.title,
+                    note_identifier=note_id,
+                    wiki_url=wiki_url or "dry-run",
+                    target_space=target_space,
+                    attachments_count=len(note.attachments),
+                )
+            )
 
-    # Finish session
+            # Check if already imported (database check - fast)
+            if skip_existing_db and not dry_run and note_id in already_imported:
+                queue_status(record_id, ImportStatus.SKIPPED, error_message="Already imported (database)")
+                skipped += 1
+                processed += 1
+                log_buffer.append(f"⏭️ Skipped (in database): {note.title}")
+                refresh_ui()
+                continue
+
+            in_flight.add(executor.submit(_process_one_note, note, record_id, note_id))
+
+            if len(in_flight) >= _MAX_WORKERS * 2:
+                done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    handle_result(future.result())
+
+        # Drain remaining uploads
+        while in_flight:
+            done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                handle_result(future.result())
+
+    # Final repaint, flush any buffered updates, then finish the session
+    refresh_ui(force=True)
+    flush_status()
+    if skip_existing_xwiki and not dry_run:
+        _cache_now = time.monotonic()
+        session_cache = st.session_state.setdefault("page_exists_cache", {})
+        for space, pages in existing_pages.items():
+            if pages is not None:
+                session_cache[space] = (_cache_now, pages)
     final_status = ImportStatus.COMPLETED if failed == 0 else ImportStatus.FAILED
     db.finish_session(session_id, final_status)
 
@@ -1614,6 +2277,61 @@ def run_import(
         st.info("This was a dry run - no changes were made to XWiki.")
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def _session_records_table(
+    _db: ImportDatabase,
+    session_id: int,
+    status_value: str | None,
+    source_file: str | None,
+    limit: int,
+    offset: int,
+) -> tuple[pd.DataFrame, bool, list[tuple[str, str, str]]]:
+    """Fetch one page of session records as a display-ready DataFrame.
+
+    Truncation, identifier shortening and time formatting happen in the
+    SQL query (SQLite's C code), so no ImportRecord objects or per-cell
+    Python string ops are paid here; only the source-file basename is
+    derived in pandas. The short TTL skips the query and rebuild entirely
+    when a rerun is triggered by an unrelated widget. Returns (table,
+    has_next_page, [(title, source_file, error_message), ...]).
+    """
+    status = ImportStatus(status_value) if status_value else None
+    rows = _db.get_session_records_display(
+        session_id,
+        status=status,
+        source_file=source_file,
+        limit=limit + 1,  # fetch one extra to detect if there's a next page
+        offset=offset,
+    )
+    has_next_page = len(rows) > limit
+    rows = rows[:limit]
+
+    if not rows:
+        return pd.DataFrame(), False, []
+
+    df = pd.DataFrame([tuple(row) for row in rows], columns=[
+        "source_file", "title", "identifier", "status", "page_url",
+        "attachments", "updated", "note_title", "error_message",
+    ])
+    names = df["source_file"].str.split("/").str[-1]
+    table = pd.DataFrame({
+        "Source File": names.where(names != "", "-"),
+        "Title": df["title"],
+        "Identifier": df["identifier"],
+        "Status": df["status"],
+        "Page URL": df["page_url"],
+        "Attachments": df["attachments"],
+        "Updated": df["updated"],
+    })
+
+    errors = [
+        (row["note_title"], row["source_file"], row["error_message"])
+        for row in rows
+        if row["error_message"]
+    ]
+    return table, has_next_page, errors
+
+
 def render_history_page(db: ImportDatabase):
     """Render the import history page."""
     render_main_header(
@@ -1621,8 +2339,9 @@ def render_history_page(db: ImportDatabase):
         "View and manage your past import sessions"
     )
 
-    # Session filter
-    sessions = db.get_recent_sessions(limit=50)
+    # Session filter — the dropdown only needs id/date/status, so fetch
+    # the three columns instead of 50 full session rows
+    sessions = db.get_recent_session_summaries(limit=50)
 
     if not sessions:
         st.info("📭 No import sessions found. Start an import to see history here.")
@@ -1630,8 +2349,8 @@ def render_history_page(db: ImportDatabase):
 
     # Session selector
     session_options = {
-        f"Session {s.id} — {s.started_at.strftime('%Y-%m-%d %H:%M')} ({s.status.value})": s.id
-        for s in sessions
+        f"Session {sid} — {started_at.strftime('%Y-%m-%d %H:%M')} ({status})": sid
+        for sid, started_at, status in sessions
     }
 
     selected = st.selectbox("📋  Select Session", options=list(session_options.keys()))
@@ -1642,15 +2361,12 @@ def render_history_page(db: ImportDatabase):
     if session:
         # Session details with styled metrics
         st.markdown("---")
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            render_metric_card("Total Notes", session.total_notes, "metric-info")
-        with col2:
-            render_metric_card("Completed", session.completed_notes, "metric-success")
-        with col3:
-            render_metric_card("Failed", session.failed_notes, "metric-danger")
-        with col4:
-            render_metric_card("Skipped", session.skipped_notes, "metric-warning")
+        render_metric_row([
+            ("Total Notes", session.total_notes, "metric-info"),
+            ("Completed", session.completed_notes, "metric-success"),
+            ("Failed", session.failed_notes, "metric-danger"),
+            ("Skipped", session.skipped_notes, "metric-warning"),
+        ])
 
         # Session info
         st.markdown("<br>", unsafe_allow_html=True)
@@ -1716,40 +2432,25 @@ def render_history_page(db: ImportDatabase):
             st.session_state[page_key] = 0
         current_page = st.session_state[page_key]
 
-        records = db.get_session_records(
+        status_value = status_map[status_filter]
+        records_table, has_next_page, error_rows = _session_records_table(
+            db,
             session_id,
-            status=status_map[status_filter],
-            source_file=file_filter_value,
-            limit=records_per_page + 1,  # fetch one extra to detect if there's a next page
-            offset=current_page * records_per_page,
+            status_value.value if status_value else None,
+            file_filter_value,
+            records_per_page,
+            current_page * records_per_page,
         )
 
-        has_next_page = len(records) > records_per_page
-        display_records = records[:records_per_page]
-
-        if display_records:
-            # Display as table
-            table_data = []
-            for r in display_records:
-                table_data.append({
-                    "Source File": Path(r.source_file).name if r.source_file else "-",
-                    "Title": r.note_title[:80] + "..." if len(r.note_title) > 80 else r.note_title,
-                    "Identifier": r.note_identifier[:8] if r.note_identifier else "-",
-                    "Status": r.status.value,
-                    "Page URL": r.page_url or "-",
-                    "Attachments": f"{r.attachments_uploaded}/{r.attachments_count}",
-                    "Updated": r.updated_at.strftime("%H:%M:%S"),
-                })
-
-            st.dataframe(table_data, use_container_width=True)
+        if not records_table.empty:
+            st.dataframe(records_table, use_container_width=True)
 
             # Show full source file path and error details in expanders
-            error_records = [r for r in display_records if r.error_message]
-            if error_records:
-                with st.expander(f"Error Details ({len(error_records)} records with errors)"):
-                    for r in error_records:
-                        st.markdown(f"**{r.note_title}** (`{r.source_file}`)")
-                        st.code(r.error_message, language=None)
+            if error_rows:
+                with st.expander(f"Error Details ({len(error_rows)} records with errors)"):
+                    for note_title, source_file, error_message in error_rows:
+                        st.markdown(f"**{note_title}** (`{source_file}`)")
+                        st.code(error_message, language=None)
                         st.markdown("---")
 
             # Pagination controls
@@ -1761,7 +2462,7 @@ def render_history_page(db: ImportDatabase):
                         st.rerun()
             with pag_col2:
                 start_record = current_page * records_per_page + 1
-                end_record = start_record + len(display_records) - 1
+                end_record = start_record + len(records_table) - 1
                 st.markdown(f"<div style='text-align:center'>Showing records {start_record}–{end_record} (page {current_page + 1})</div>", unsafe_allow_html=True)
             with pag_col3:
                 if has_next_page:
@@ -1783,21 +2484,23 @@ def render_history_page(db: ImportDatabase):
 
 def render_reconciliation_page(db: ImportDatabase):
     """Render the reconciliation tool page."""
+    from Evernote_Extractor.progress import generate_note_identifier
+
     render_main_header(
         "Reconciliation",
         "Compare ENEX source files against import records to find missing or orphaned notes"
     )
 
     # Session selector (reuse pattern from history page)
-    sessions = db.get_recent_sessions(limit=50)
+    sessions = db.get_recent_session_summaries(limit=50)
 
     if not sessions:
         st.info("No import sessions found. Run an import first.")
         return
 
     session_options = {
-        f"Session {s.id} — {s.started_at.strftime('%Y-%m-%d %H:%M')} ({s.status.value})": s.id
-        for s in sessions
+        f"Session {sid} — {started_at.strftime('%Y-%m-%d %H:%M')} ({status})": sid
+        for sid, started_at, status in sessions
     }
 
     selected = st.selectbox("Select Import Session", options=list(session_options.keys()), key="recon_session")
@@ -1815,14 +2518,16 @@ def render_reconciliation_page(db: ImportDatabase):
     )
 
     if st.button("Run Reconciliation", type="primary"):
-        if not source_path or not Path(source_path).exists():
+        if not source_path or not _path_exists(source_path):
             st.error("Please enter a valid path to an ENEX file or directory.")
             return
 
         # Step 1: Build ENEX inventory
         with st.spinner("Scanning ENEX files..."):
             try:
-                inventory, enex_total = build_enex_inventory(source_path)
+                inventory, enex_total = _cached_enex_inventory(
+                    source_path, _enex_fingerprint(Path(source_path))
+                )
             except Exception as e:
                 st.error(f"Error scanning ENEX files: {e}")
                 return
@@ -1863,15 +2568,12 @@ def render_reconciliation_page(db: ImportDatabase):
         st.markdown("---")
         render_section_header("Reconciliation Results", "📊")
 
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            render_metric_card("ENEX Notes", enex_total, "metric-info")
-        with col2:
-            render_metric_card("DB Records", len(records), "metric-info")
-        with col3:
-            render_metric_card("Missing from DB", len(in_enex_not_db), "metric-danger" if in_enex_not_db else "metric-success")
-        with col4:
-            render_metric_card("Orphaned in DB", len(in_db_not_enex), "metric-warning" if in_db_not_enex else "metric-success")
+        render_metric_row([
+            ("ENEX Notes", enex_total, "metric-info"),
+            ("DB Records", len(records), "metric-info"),
+            ("Missing from DB", len(in_enex_not_db), "metric-danger" if in_enex_not_db else "metric-success"),
+            ("Orphaned in DB", len(in_db_not_enex), "metric-warning" if in_db_not_enex else "metric-success"),
+        ])
 
         # Per-file status breakdown
         st.markdown("---")
@@ -1911,9 +2613,10 @@ def render_reconciliation_page(db: ImportDatabase):
 
             for file_path_str, notes in missing_by_file.items():
                 with st.expander(f"{Path(file_path_str).name} — {len(notes)} missing"):
-                    for n in notes:
-                        created_str = n["created"].strftime("%Y-%m-%d %H:%M") if n["created"] else "no date"
-                        st.markdown(f"- **{n['title']}** ({created_str})")
+                    st.markdown("\n".join(
+                        f"- **{n['title']}** ({n['created'].strftime('%Y-%m-%d %H:%M') if n['created'] else 'no date'})"
+                        for n in notes
+                    ))
 
         # Detail: notes in DB but not in ENEX
         if in_db_not_enex:
@@ -1930,8 +2633,10 @@ def render_reconciliation_page(db: ImportDatabase):
 
             for file_path_str, notes in orphan_by_file.items():
                 with st.expander(f"{Path(file_path_str).name} — {len(notes)} orphaned"):
-                    for n in notes:
-                        st.markdown(f"- **{n['title']}** (status: {n['status']})")
+                    st.markdown("\n".join(
+                        f"- **{n['title']}** (status: {n['status']})"
+                        for n in notes
+                    ))
 
         if not in_enex_not_db and not in_db_not_enex:
             st.success("All ENEX notes have matching database records. No discrepancies found.")
@@ -1947,19 +2652,12 @@ def render_stats_page(db: ImportDatabase):
     stats = db.get_stats()
 
     # Main metrics
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        render_metric_card("Total Processed", stats["total_notes"], "metric-info")
-
-    with col2:
-        render_metric_card("Imported", stats["completed"], "metric-success")
-
-    with col3:
-        render_metric_card("Failed", stats["failed"], "metric-danger")
-
-    with col4:
-        render_metric_card("Sessions", stats["total_sessions"], "")
+    render_metric_row([
+        ("Total Processed", stats["total_notes"], "metric-info"),
+        ("Imported", stats["completed"], "metric-success"),
+        ("Failed", stats["failed"], "metric-danger"),
+        ("Sessions", stats["total_sessions"], ""),
+    ])
 
     # Success rate
     st.markdown("<br>", unsafe_allow_html=True)
@@ -1977,32 +2675,38 @@ def render_stats_page(db: ImportDatabase):
     sessions = db.get_recent_sessions(limit=10)
 
     if sessions:
-        table_data = []
-        for s in sessions:
-            duration = ""
-            if s.finished_at:
-                delta = s.finished_at - s.started_at
-                duration = f"{delta.seconds // 60}m {delta.seconds % 60}s"
-
-            # Add status emoji
-            status_emoji = {
-                "completed": "✅",
-                "failed": "❌",
-                "in_progress": "⏳",
-                "pending": "⏸️"
-            }.get(s.status.value, "")
-
-            table_data.append({
-                "ID": s.id,
-                "Started": s.started_at.strftime("%Y-%m-%d %H:%M"),
-                "Status": f"{status_emoji} {s.status.value}",
-                "Total": s.total_notes,
-                "Completed": s.completed_notes,
-                "Failed": s.failed_notes,
-                "Duration": duration or "⏳ In progress",
-            })
-
-        st.dataframe(table_data, use_container_width=True, hide_index=True)
+        # Vectorized column build (matching the history table): the
+        # strftime and duration math run once per column in C instead of
+        # once per row in Python.
+        df = pd.DataFrame([s.__dict__ for s in sessions])
+        started = pd.to_datetime(df["started_at"])
+        finished = pd.to_datetime(df["finished_at"])
+        secs = (finished - started).dt.total_seconds()
+        duration = (
+            (secs // 60).fillna(0).astype(int).astype(str)
+            + "m "
+            + (secs % 60).fillna(0).astype(int).astype(str)
+            + "s"
+        ).where(finished.notna(), "⏳ In progress")
+        status = df["status"].map(lambda s: s.value)
+        status_emoji = status.map({
+            "completed": "✅",
+            "failed": "❌",
+            "in_progress": "⏳",
+            "pending": "⏸️",
+        }).fillna("")
+
+        table = pd.DataFrame({
+            "ID": df["id"],
+            "Started": started.dt.strftime("%Y-%m-%d %H:%M"),
+            "Status": status_emoji + " " + status,
+            "Total": df["total_notes"],
+            "Completed": df["completed_notes"],
+            "Failed": df["failed_notes"],
+            "Duration": duration,
+        })
+
+        st.dataframe(table, use_container_width=True, hide_index=True)
     else:
         st.info("📭 No sessions found.")
 
@@ -1,7 +1,10 @@
 """Command-line interface for Evernote to XWiki extractor."""
 
+import atexit
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import click
@@ -66,6 +69,12 @@ def cli():
     default=0.5,
     help="Delay between API requests in seconds (default: 0.5)",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=4,
+    help="Concurrent upload threads (default: 4)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -82,6 +91,7 @@ def import_notes(
     state_file: str | None,
     skip_existing: bool,
     rate_limit: float,
+    workers: int,
     verbose: bool,
 ):
     """Import Evernote notes from ENEX file(s) to XWiki.
@@ -117,8 +127,11 @@ def import_notes(
             sys.exit(1)
         click.echo("Connected successfully.")
 
-    # Initialize progress tracker
+    # Initialize progress tracker. State writes are batched (see the flush
+    # calls in the import loop); register a last-chance flush so an abrupt
+    # exit still persists the tail of the batch.
     tracker = ProgressTracker(state_file)
+    atexit.register(tracker.flush)
 
     if resume:
         if tracker.load():
@@ -134,14 +147,17 @@ def import_notes(
         total_notes = count_notes_in_enex(source_path)
         click.echo(f"Found {total_notes} notes in {source_path.name}")
     else:
-        # Recursively find all ENEX files
+        # Recursively find all ENEX files and count them in parallel; the
+        # mmap-based counter is I/O-bound, so threads overlap the reads.
         enex_files = list(source_path.rglob("*.enex"))
-        for enex_file in enex_files:
-            count = count_notes_in_enex(enex_file)
-            total_notes += count
+        if enex_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(enex_files))) as pool:
+                counts = list(pool.map(count_notes_in_enex, enex_files))
+            total_notes = sum(counts)
             if verbose:
-                relative = enex_file.relative_to(source_path)
-                click.echo(f"  {relative}: {count} notes")
+                for enex_file, count in zip(enex_files, counts):
+                    relative = enex_file.relative_to(source_path)
+                    click.echo(f"  {relative}: {count} notes")
         click.echo(f"Found {total_notes} notes in {len(enex_files)} files")
 
     if total_notes == 0:
@@ -161,83 +177,143 @@ def import_notes(
     else:
         notes_iter = parse_enex_directory(source_path)
 
-    with click.progressbar(
-        notes_iter,
-        length=total_notes,
-        label="Importing notes",
-        show_pos=True,
-    ) as notes:
-        for file_path, note in notes:
-            # Generate identifier
-            note_id = generate_note_identifier(note.title, note.created)
-
-            # Register note for tracking
-            tracker.register_note(
-                identifier=note_id,
-                title=note.title,
-                source_file=str(file_path),
+    # Convert + upload runs on worker threads so HTTP round-trips overlap
+    # (the XWiki client's session pool and rate limiting are thread-safe);
+    # tracker writes stay on this thread, fed by completed futures.
+    max_workers = max(1, workers)
+
+    def _process_one(note, note_id: str) -> tuple:
+        """Convert and upload one note. No tracker access on this thread.
+
+        Returns (note_id, title, outcome, detail).
+        """
+        try:
+            page = convert_note(note, space)
+        except Exception as e:
+            return (note_id, note.title, "convert_failed", f"Conversion error: {e}")
+
+        if dry_run:
+            # Return a summary, not the ConvertedPage: a completed future
+            # sits in the done set until the main thread handles it, and
+            # holding the page there would keep its content and attachment
+            # bytes alive past the bounded in-flight window.
+            return (
+                note_id,
+                note.title,
+                "dry_run",
+                (page.title, page.space, page.page_name, len(page.content), len(page.attachments), page.tags),
+            )
+
+        # Existence checks go through the client's cache: the first check
+        # in a space fetches the bulk listing once, later ones are dict
+        # lookups. Saves one HTTP round trip per note.
+        if skip_existing and client and client.page_exists_cached(page.space, page.page_name):
+            return (note_id, note.title, "exists", None)
+
+        result = client.create_or_update_page(page, dry_run=False)
+        if result.success:
+            return (
+                note_id,
+                note.title,
+                "uploaded",
+                (result.page_url, result.attachments_uploaded, result.attachments_failed),
             )
+        return (note_id, note.title, "failed", result.error or "Unknown error")
+
+    # Tracker mutations stay in memory and hit disk every K results, so a
+    # large import rewrites the state file N/K times instead of N.
+    _TRACKER_FLUSH_EVERY = 25
+    results_handled = 0
 
-            # Check if already processed
-            if resume and tracker.is_processed(note_id):
-                if verbose:
-                    click.echo(f"\nSkipping (already processed): {note.title}")
-                skipped += 1
-                continue
-
-            # Check if should retry
-            if resume and not retry_failed and not tracker.should_retry(note_id):
-                if verbose:
-                    click.echo(f"\nSkipping (previously failed): {note.title}")
-                skipped += 1
-                continue
-
-            # Convert note
-            try:
-                page = convert_note(note, space)
-            except Exception as e:
-                tracker.mark_failed(note_id, f"Conversion error: {e}")
-                failed += 1
-                if verbose:
-                    click.echo(f"\nConversion failed: {note.title} - {e}")
-                continue
-
-            if dry_run:
-                if verbose:
-                    click.echo(f"\n[DRY RUN] Would upload: {page.title} to {page.space}/{page.page_name}")
-                    click.echo(f"  Content length: {len(page.content)} chars")
-                    click.echo(f"  Attachments: {len(page.attachments)}")
-                    click.echo(f"  Tags: {page.tags}")
-                tracker.mark_uploaded(note_id, f"[dry-run] {page.space}/{page.page_name}")
-                uploaded += 1
-                continue
-
-            # Check if page exists
-            if skip_existing and client and client.page_exists(page.space, page.page_name):
-                tracker.mark_skipped(note_id, "Page already exists")
-                skipped += 1
-                if verbose:
-                    click.echo(f"\nSkipping (exists): {note.title}")
-                continue
-
-            # Upload to XWiki
-            if client:
-                result = client.create_or_update_page(page, dry_run=False)
-
-                if result.success:
-                    tracker.mark_uploaded(note_id, result.page_url)
-                    uploaded += 1
+    def _handle_result(result: tuple) -> None:
+        nonlocal uploaded, failed, skipped, results_handled
+        note_id, title, outcome, detail = result
+
+        if outcome == "uploaded":
+            page_url, attachments_uploaded, attachments_failed = detail
+            tracker.mark_uploaded(note_id, page_url)
+            uploaded += 1
+            if verbose:
+                click.echo(f"\nUploaded: {title}")
+                if attachments_uploaded > 0:
+                    click.echo(f"  Attachments: {attachments_uploaded} uploaded")
+                if attachments_failed > 0:
+                    click.echo(f"  Attachments failed: {attachments_failed}")
+        elif outcome == "dry_run":
+            page_title, page_space, page_name, content_len, attachment_count, tags = detail
+            if verbose:
+                click.echo(f"\n[DRY RUN] Would upload: {page_title} to {page_space}/{page_name}")
+                click.echo(f"  Content length: {content_len} chars")
+                click.echo(f"  Attachments: {attachment_count}")
+                click.echo(f"  Tags: {tags}")
+            tracker.mark_uploaded(note_id, f"[dry-run] {page_space}/{page_name}")
+            uploaded += 1
+        elif outcome == "exists":
+            tracker.mark_skipped(note_id, "Page already exists")
+            skipped += 1
+            if verbose:
+                click.echo(f"\nSkipping (exists): {title}")
+        else:
+            tracker.mark_failed(note_id, detail)
+            failed += 1
+            if verbose:
+                click.echo(f"\nFailed: {title} - {detail}")
+
+        results_handled += 1
+        if results_handled % _TRACKER_FLUSH_EVERY == 0:
+            tracker.flush()
+
+    in_flight: set = set()
+
+    try:
+        with click.progressbar(
+            notes_iter,
+            length=total_notes,
+            label="Importing notes",
+            show_pos=True,
+        ) as notes, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, note in notes:
+                # Generate identifier
+                note_id = generate_note_identifier(note.title, note.created)
+
+                # Register note for tracking
+                tracker.register_note(
+                    identifier=note_id,
+                    title=note.title,
+                    source_file=str(file_path),
+                )
+
+                # Check if already processed
+                if resume and tracker.is_processed(note_id):
                     if verbose:
-                        click.echo(f"\nUploaded: {note.title}")
-                        if result.attachments_uploaded > 0:
-                            click.echo(f"  Attachments: {result.attachments_uploaded} uploaded")
-                        if result.attachments_failed > 0:
-                            click.echo(f"  Attachments failed: {result.attachments_failed}")
-                else:
-                    tracker.mark_failed(note_id, result.error or "Unknown error")
-                    failed += 1
+                        click.echo(f"\nSkipping (already processed): {note.title}")
+                    skipped += 1
+                    continue
+
+                # Check if should retry
+                if resume and not retry_failed and not tracker.should_retry(note_id):
                     if verbose:
-                        click.echo(f"\nFailed: {note.title} - {result.error}")
+                        click.echo(f"\nSkipping (previously failed): {note.title}")
+                    skipped += 1
+                    continue
+
+                in_flight.add(executor.submit(_process_one, note, note_id))
+
+                # Bound in-flight work so parsing cannot outrun the uploads
+                if len(in_flight) >= max_workers * 2:
+                    done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done_futures:
+                        _handle_result(future.result())
+
+            # Drain remaining uploads
+            while in_flight:
+                done_futures, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    _handle_result(future.result())
+    finally:
+        # Persist the tail of the current batch even on Ctrl-C so a resumed
+        # run does not redo notes that already uploaded.
+        tracker.flush()
 
     # Final summary
     click.echo("\n" + "=" * 50)
@@ -283,6 +359,11 @@ def convert(source: str, output: str | None, verbose: bool):
 
     converted = 0
 
+    # Next free suffix per base name: duplicates within this run resolve
+    # with a dict lookup instead of stat()ing every earlier copy, and
+    # open(..., "x") catches files left by previous runs atomically.
+    name_counters: defaultdict[str, int] = defaultdict(int)
+
     if source_path.is_file():
         notes_iter = parse_enex_file(source_path)
     else:
@@ -294,15 +375,20 @@ def convert(source: str, output: str | None, verbose: bool):
 
             # Save converted content
             safe_name = page.page_name[:50]  # Limit filename length
-            output_file = output_path / f"{safe_name}.txt"
 
             # Handle duplicate filenames
-            counter = 1
-            while output_file.exists():
-                output_file = output_path / f"{safe_name}_{counter}.txt"
-                counter += 1
-
-            with open(output_file, "w") as f:
+            while True:
+                counter = name_counters[safe_name]
+                name_counters[safe_name] = counter + 1
+                suffix = f"_{counter}" if counter else ""
+                output_file = output_path / f"{safe_name}{suffix}.txt"
+                try:
+                    f = open(output_file, "x")
+                    break
+                except FileExistsError:
+                    continue
+
+            with f:
                 f.write(f"Title: {page.title}\n")
                 f.write(f"Space: {page.space}\n")
                 f.write(f"Tags: {', '.join(page.tags)}\n")
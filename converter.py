@@ -2,6 +2,8 @@
 
 import hashlib
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
 from io import StringIO
 from urllib.parse import urlparse
@@ -11,11 +13,36 @@ from lxml import etree
 
 from .models import Attachment, ConvertedPage, Note
 
+# Parser instances are stateless between parses, so allocate them once at
+# module load instead of once per note.
+_XML_PARSER = etree.XMLParser(recover=True, huge_tree=True)
+_HTML_PARSER = etree.HTMLParser()
+
+# Compiled once at import: these run per note (or per image URL), and
+# precompiling skips re's per-call cache lookup on the hot path.
+_RE_XML_DECL = re.compile(r'<\?xml[^?]*\?>')
+_RE_DOCTYPE = re.compile(r'<!DOCTYPE[^>]*>')
+_RE_MULTI_NEWLINE = re.compile(r'\n{3,}')
+_RE_UNSAFE_FILENAME = re.compile(r'[^\w\-_.]')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+
+# Local-name lookup memo shared by all converter instances: ENML uses a
+# small fixed tag vocabulary and lxml interns tag strings, so this
+# saturates after a handful of entries.
+_TAG_CACHE: dict[str, str] = {}
+
+# Distinguishes "cached None" from "not cached" in the hash-lookup memo.
+_MISSING = object()
+
+# Shared session for external image downloads: keep-alive reuses the TCP
+# (and TLS) connection when a note pulls several images from one host.
+_IMAGE_SESSION = requests.Session()
+
 
 def download_image(url: str, timeout: int = 10) -> Attachment | None:
     """Download an image from a URL and return as an Attachment."""
     try:
-        response = requests.get(url, timeout=timeout, stream=True)
+        response = _IMAGE_SESSION.get(url, timeout=timeout, stream=True)
         response.raise_for_status()
 
         # Get content type
@@ -27,11 +54,17 @@ def download_image(url: str, timeout: int = 10) -> Attachment | None:
         if not content_type.startswith("image/"):
             return None
 
-        # Read the data
-        data = response.content
-
-        # Generate hash
-        hash_value = hashlib.md5(data).hexdigest()
+        # Stream the body in blocks, hashing as each arrives, instead of
+        # materializing it first and making a second full pass for the
+        # digest. The hash only disambiguates filenames, so the
+        # non-security MD5 path (faster where OpenSSL offers it) is fine.
+        digest = hashlib.md5(usedforsecurity=False)
+        chunks: list[bytes] = []
+        for chunk in response.iter_content(65536):
+            digest.update(chunk)
+            chunks.append(chunk)
+        data = b"".join(chunks)
+        hash_value = digest.hexdigest()
 
         # Generate filename from URL or hash
         parsed_url = urlparse(url)
@@ -39,7 +72,7 @@ def download_image(url: str, timeout: int = 10) -> Attachment | None:
         if path and "/" in path:
             filename = path.split("/")[-1]
             # Clean up filename
-            filename = re.sub(r'[^\w\-_.]', '_', filename)
+            filename = _RE_UNSAFE_FILENAME.sub('_', filename)
         else:
             filename = hash_value
 
@@ -76,7 +109,13 @@ class ENMLToXWikiConverter:
 
     def __init__(self, note: Note, download_external_images: bool = True):
         self.note = note
-        self.output = StringIO()
+        # Output accumulates as a list of fragments joined once at the
+        # end; appending to a list beats StringIO for this append-then-
+        # read-once pattern (no internal buffer reallocation).
+        self._chunks: list[str] = []
+        # True while the output is empty or ends with a newline; kept up
+        # to date by _emit so block handlers never inspect the buffer.
+        self._ends_with_newline = True
         self.list_stack: list[str] = []  # Track nested list types
         self.in_table = False
         self.table_rows: list[list[str]] = []
@@ -92,13 +131,31 @@ class ENMLToXWikiConverter:
             normalized_hash = att.hash.lower().replace("-", "")
             self.attachment_hash_map[normalized_hash] = att
             self.used_filenames.add(att.filename.lower())
+        # External images downloaded ahead of the tree walk, keyed by URL
+        # (None records a failed download so it is not retried inline).
+        self._img_cache: dict[str, Attachment | None] = {}
+        # Finalized (renamed) attachments keyed by source URL, and by
+        # content hash so distinct URLs serving identical bytes share one
+        # attachment instead of being stored and uploaded twice.
+        self._url_to_attachment: dict[str, Attachment] = {}
+        self._downloaded_hashes: dict[str, Attachment] = {}
+        # Memo for raw hash strings as they appear in en-media elements;
+        # notes often reference the same attachment many times, and this
+        # skips re-normalizing the string each time. Holds None results
+        # too (hence the sentinel in _find_attachment_by_hash).
+        self._hash_lookup_cache: dict[str, Attachment | None] = {}
 
     def _find_attachment_by_hash(self, hash_value: str) -> Attachment | None:
         """Find attachment by hash, handling various hash formats."""
         if not hash_value:
             return None
+        cached = self._hash_lookup_cache.get(hash_value, _MISSING)
+        if cached is not _MISSING:
+            return cached
         normalized = hash_value.lower().replace("-", "")
-        return self.attachment_hash_map.get(normalized)
+        attachment = self.attachment_hash_map.get(normalized)
+        self._hash_lookup_cache[hash_value] = attachment
+        return attachment
 
     def convert(self) -> str:
         """Convert the note's ENML content to XWiki syntax."""
@@ -111,18 +168,16 @@ class ENMLToXWikiConverter:
         # Parse the ENML content
         try:
             # Remove XML declaration and DOCTYPE if present
-            content = re.sub(r'<\?xml[^?]*\?>', '', content)
-            content = re.sub(r'<!DOCTYPE[^>]*>', '', content)
+            content = _RE_XML_DECL.sub('', content)
+            content = _RE_DOCTYPE.sub('', content)
             content = content.strip()
 
             # Try XML parser first to preserve custom ENML tags
             try:
-                parser = etree.XMLParser(recover=True, huge_tree=True)
-                root = etree.fromstring(content.encode('utf-8'), parser)
+                root = etree.fromstring(content.encode('utf-8'), _XML_PARSER)
             except Exception:
                 # Fallback to HTML parser
-                parser = etree.HTMLParser()
-                tree = etree.parse(StringIO(content), parser)
+                tree = etree.parse(StringIO(content), _HTML_PARSER)
                 root = tree.getroot()
 
             # Find the en-note element or body
@@ -134,97 +189,84 @@ class ENMLToXWikiConverter:
             if en_note is None:
                 en_note = root
 
+            # Fetch external images concurrently before the tree walk so
+            # _handle_image hits the cache instead of blocking per <img>.
+            if self.download_external_images:
+                self._prefetch_external_images(en_note)
+
             self._process_element(en_note)
 
         except etree.XMLSyntaxError:
             # Fallback: strip HTML tags and return plain text
             return self._strip_html(content)
 
-        result = self.output.getvalue()
+        result = "".join(self._chunks)
 
         # Clean up excessive newlines
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = _RE_MULTI_NEWLINE.sub('\n\n', result)
         result = result.strip()
 
         return result
 
+    def _prefetch_external_images(self, root: etree._Element) -> None:
+        """Download all external <img> sources into the URL cache.
+
+        The downloads are pure I/O, so running them on a small pool cuts
+        a many-image note from sum-of-round-trips to roughly the slowest
+        single one. Duplicate URLs are fetched once.
+        """
+        urls: list[str] = []
+        for img in root.iter("{*}img"):
+            src = img.get("src", "")
+            if src.startswith(("http://", "https://")) and src not in self._img_cache:
+                self._img_cache[src] = None  # reserve to dedupe
+                urls.append(src)
+
+        if not urls:
+            return
+
+        if len(urls) == 1:
+            self._img_cache[urls[0]] = download_image(urls[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as pool:
+            for url, attachment in zip(urls, pool.map(download_image, urls)):
+                self._img_cache[url] = attachment
+
+    def _emit(self, fragment: str) -> None:
+        """Append an output fragment, tracking the trailing-newline state."""
+        if fragment:
+            self._chunks.append(fragment)
+            self._ends_with_newline = fragment.endswith("\n")
+
     def _get_tag_name(self, element: etree._Element) -> str:
         """Get the local tag name, stripping any namespace."""
-        tag = element.tag if element.tag else ""
-        # Strip namespace if present (e.g., {http://...}tagname -> tagname)
-        if tag.startswith("{"):
-            tag = tag.split("}", 1)[-1]
-        return tag.lower()
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions carry callable tags
+            return ""
+
+        cached = _TAG_CACHE.get(tag)
+        if cached is None:
+            # Strip namespace if present (e.g., {http://...}tagname -> tagname)
+            name = tag
+            if name.startswith("{"):
+                name = name.split("}", 1)[-1]
+            cached = _TAG_CACHE[tag] = name.lower()
+        return cached
 
     def _process_element(self, element: etree._Element, depth: int = 0) -> None:
-        """Process an element and its children."""
-        tag = self._get_tag_name(element)
+        """Process an element and its children.
 
-        # Inline formatting tags - handle specially to preserve text flow
-        if tag in ("b", "strong"):
-            self._handle_inline_format(element, "**", "**")
-            return
-        elif tag in ("i", "em"):
-            self._handle_inline_format(element, "//", "//")
-            return
-        elif tag == "u":
-            self._handle_inline_format(element, "__", "__")
-            return
-        elif tag in ("s", "strike", "del"):
-            self._handle_inline_format(element, "--", "--")
-            return
-        elif tag == "a":
-            self._handle_link(element)
-            return
-        elif tag == "en-media":
-            self._handle_media(element)
-            if element.tail:
-                self._write_text(element.tail)
-            return
-        elif tag == "img":
-            self._handle_image(element)
-            if element.tail:
-                self._write_text(element.tail)
-            return
-        elif tag == "br":
-            self.output.write("\n")
-            if element.tail:
-                self._write_text(element.tail)
-            return
-        elif tag == "en-todo":
-            self._handle_todo(element)
-            if element.tail:
-                self._write_text(element.tail)
-            return
+        Dispatches through _TAG_DISPATCH (one dict lookup per element
+        instead of walking an if/elif chain); handlers emit the element's
+        own content, and tail text is written here for every tag.
+        """
+        tag = self._get_tag_name(element)
 
-        # Block-level elements
-        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
-            self._handle_heading(element, int(tag[1]))
-        elif tag == "ul":
-            self._handle_list(element, ordered=False)
-        elif tag == "ol":
-            self._handle_list(element, ordered=True)
-        elif tag == "li":
-            self._handle_list_item(element)
-        elif tag == "hr":
-            self.output.write("\n----\n")
-        elif tag in ("p", "div"):
-            self._handle_block(element)
-        elif tag == "table":
-            self._handle_table(element)
-        elif tag == "tr":
-            self._handle_table_row(element)
-        elif tag in ("td", "th"):
-            self._handle_table_cell(element, is_header=(tag == "th"))
-        elif tag == "blockquote":
-            self._handle_blockquote(element)
-        elif tag in ("code", "pre"):
-            self._handle_code(element)
-        elif tag == "en-crypt":
-            self._handle_encrypted(element)
-        elif tag == "span":
-            # Check for style-based formatting
-            self._handle_span(element)
+        handler = self._TAG_DISPATCH.get(tag)
+        if handler is not None:
+            handler(self, element)
         else:
             # For unknown tags, process text and children
             if element.text:
@@ -243,7 +285,7 @@ class ENMLToXWikiConverter:
             text = unescape(text)
             # Escape XWiki special characters
             text = self._escape_xwiki(text)
-            self.output.write(text)
+            self._emit(text)
 
     def _escape_xwiki(self, text: str) -> str:
         """Escape special XWiki characters in regular text."""
@@ -254,7 +296,7 @@ class ENMLToXWikiConverter:
 
     def _handle_inline_format(self, element: etree._Element, prefix: str, suffix: str) -> None:
         """Handle inline formatting (bold, italic, etc.) with proper text flow."""
-        self.output.write(prefix)
+        self._emit(prefix)
 
         # Write element's text content
         if element.text:
@@ -264,11 +306,7 @@ class ENMLToXWikiConverter:
         for child in element:
             self._process_element(child)
 
-        self.output.write(suffix)
-
-        # Handle tail text (text after this element)
-        if element.tail:
-            self._write_text(element.tail)
+        self._emit(suffix)
 
     def _handle_span(self, element: etree._Element) -> None:
         """Handle span elements, checking for style-based formatting."""
@@ -293,7 +331,7 @@ class ENMLToXWikiConverter:
                 suffix = "--" + suffix
 
         if prefix:
-            self.output.write(prefix)
+            self._emit(prefix)
 
         if element.text:
             self._write_text(element.text)
@@ -302,22 +340,19 @@ class ENMLToXWikiConverter:
             self._process_element(child)
 
         if suffix:
-            self.output.write(suffix)
-
-        if element.tail:
-            self._write_text(element.tail)
+            self._emit(suffix)
 
     def _handle_heading(self, element: etree._Element, level: int) -> None:
         """Convert heading to XWiki syntax."""
         # XWiki headings: = H1 =, == H2 ==, etc.
         equals = "=" * level
-        self.output.write(f"\n{equals} ")
+        self._emit(f"\n{equals} ")
 
         # Get text content
         text = self._get_element_text(element)
-        self.output.write(text)
+        self._emit(text)
 
-        self.output.write(f" {equals}\n")
+        self._emit(f" {equals}\n")
 
     def _handle_link(self, element: etree._Element) -> None:
         """Convert hyperlink to XWiki syntax."""
@@ -327,29 +362,25 @@ class ENMLToXWikiConverter:
         if href:
             if text and text != href:
                 # [[label>>url]]
-                self.output.write(f"[[{text}>>{href}]]")
+                self._emit(f"[[{text}>>{href}]]")
             else:
                 # [[url]]
-                self.output.write(f"[[{href}]]")
+                self._emit(f"[[{href}]]")
         else:
             self._write_text(text)
 
-        # Handle tail text
-        if element.tail:
-            self._write_text(element.tail)
-
     def _handle_list(self, element: etree._Element, ordered: bool) -> None:
         """Handle ordered and unordered lists."""
         list_type = "1." if ordered else "*"
         self.list_stack.append(list_type)
 
-        self.output.write("\n")
+        self._emit("\n")
         for child in element:
             self._process_element(child)
 
         self.list_stack.pop()
         if not self.list_stack:
-            self.output.write("\n")
+            self._emit("\n")
 
     def _handle_list_item(self, element: etree._Element) -> None:
         """Handle list items."""
@@ -362,7 +393,7 @@ class ENMLToXWikiConverter:
                 else:
                     prefix += "*"
 
-            self.output.write(f"{prefix} ")
+            self._emit(f"{prefix} ")
 
         # Write element's text
         if element.text:
@@ -372,19 +403,18 @@ class ENMLToXWikiConverter:
         for child in element:
             tag = self._get_tag_name(child)
             if tag in ("ul", "ol"):
-                self.output.write("\n")
+                self._emit("\n")
                 self._process_element(child)
             else:
                 self._process_element(child)
 
-        self.output.write("\n")
+        self._emit("\n")
 
     def _handle_block(self, element: etree._Element) -> None:
         """Handle block elements like div and p."""
-        # Add newline before block if needed
-        current = self.output.getvalue()
-        if current and not current.endswith("\n"):
-            self.output.write("\n")
+        # Add newline before block if needed (O(1) flag check)
+        if not self._ends_with_newline:
+            self._emit("\n")
 
         # Write element's text content
         if element.text:
@@ -395,30 +425,14 @@ class ENMLToXWikiConverter:
             self._process_element(child)
 
         # Add newline after block
-        self.output.write("\n")
+        self._emit("\n")
 
     def _handle_media(self, element: etree._Element) -> None:
         """Handle en-media elements (attachments in ENML)."""
-        # Try different attribute names (case variations)
-        media_hash = (
-            element.get("hash") or
-            element.get("Hash") or
-            element.get("HASH") or
-            ""
-        )
-        media_type = (
-            element.get("type") or
-            element.get("Type") or
-            element.get("TYPE") or
-            ""
-        )
-
-        if not media_hash:
-            # Try to get from all attributes
-            for key, value in element.attrib.items():
-                if key.lower() == "hash":
-                    media_hash = value
-                    break
+        # One case-normalized pass over the attributes covers every
+        # capitalization variant (hash/Hash/HASH/...) in a single scan.
+        attrs = {key.lower(): value for key, value in element.attrib.items()}
+        media_hash = attrs.get("hash", "")
 
         if not media_hash:
             return
@@ -430,14 +444,14 @@ class ENMLToXWikiConverter:
             filename = attachment.filename
             if attachment.is_image:
                 # XWiki image syntax with width parameter for better display
-                self.output.write(f"[[image:{filename}]]")
+                self._emit(f"[[image:{filename}]]")
             else:
                 # XWiki attachment link
-                self.output.write(f"[[{filename}>>attach:{filename}]]")
+                self._emit(f"[[{filename}>>attach:{filename}]]")
         else:
             # Attachment not found - log the hash for debugging
             short_hash = media_hash[:8] if len(media_hash) > 8 else media_hash
-            self.output.write(f"[Missing attachment: {short_hash}...]")
+            self._emit(f"[Missing attachment: {short_hash}...]")
 
     def _handle_image(self, element: etree._Element) -> None:
         """Handle img elements - download external images and store as attachments."""
@@ -448,36 +462,56 @@ class ENMLToXWikiConverter:
             # Data URI - try to decode and save as attachment
             attachment = self._decode_data_uri(src)
             if attachment:
-                self.downloaded_images.append(attachment)
-                self.output.write(f"[[image:{attachment.filename}]]")
+                # Identical embedded payloads share one attachment
+                known = self._downloaded_hashes.get(attachment.hash)
+                if known is None:
+                    known = attachment
+                    self.downloaded_images.append(known)
+                    self._downloaded_hashes[known.hash] = known
+                self._emit(f"[[image:{known.filename}]]")
             else:
-                self.output.write(f"[Image: {alt or 'embedded data'}]")
+                self._emit(f"[Image: {alt or 'embedded data'}]")
         elif src.startswith(("http://", "https://")):
             # External URL - download and save as attachment
             if self.download_external_images:
-                attachment = download_image(src)
-                if attachment:
-                    # Ensure unique filename
-                    filename = self._get_unique_filename(attachment.filename)
-                    attachment = Attachment(
-                        filename=filename,
-                        mime_type=attachment.mime_type,
-                        data=attachment.data,
-                        hash=attachment.hash,
-                    )
-                    self.downloaded_images.append(attachment)
-                    self.used_filenames.add(filename.lower())
-                    self.output.write(f"[[image:{filename}]]")
+                final = self._url_to_attachment.get(src)
+                if final is None:
+                    attachment = self._img_cache.get(src, _MISSING)
+                    if attachment is _MISSING:
+                        # Not seen by the pre-pass (e.g. odd markup); fetch inline
+                        attachment = download_image(src)
+                        self._img_cache[src] = attachment
+                    if attachment:
+                        # A different URL serving the same bytes reuses
+                        # the already-stored copy
+                        final = self._downloaded_hashes.get(attachment.hash)
+                        if final is None:
+                            # Ensure unique filename
+                            filename = self._get_unique_filename(
+                                attachment.filename, attachment.hash
+                            )
+                            final = Attachment(
+                                filename=filename,
+                                mime_type=attachment.mime_type,
+                                data=attachment.data,
+                                hash=attachment.hash,
+                            )
+                            self.downloaded_images.append(final)
+                            self.used_filenames.add(filename.lower())
+                            self._downloaded_hashes[final.hash] = final
+                        self._url_to_attachment[src] = final
+                if final is not None:
+                    self._emit(f"[[image:{final.filename}]]")
                 else:
                     # Failed to download - keep as external link with note
-                    self.output.write(f"[[image:{src}]]")
-                    self.output.write(f" //(external image)//" )
+                    self._emit(f"[[image:{src}]]")
+                    self._emit(f" //(external image)//" )
             else:
                 # Not downloading - just reference the URL
-                self.output.write(f"[[image:{src}]]")
+                self._emit(f"[[image:{src}]]")
         elif src:
             # Relative or other URL - keep as-is
-            self.output.write(f"[[image:{src}]]")
+            self._emit(f"[[image:{src}]]")
 
     def _decode_data_uri(self, data_uri: str) -> Attachment | None:
         """Decode a data URI into an Attachment."""
@@ -495,7 +529,7 @@ class ENMLToXWikiConverter:
                 return None
 
             image_data = base64.b64decode(data)
-            hash_value = hashlib.md5(image_data).hexdigest()
+            hash_value = hashlib.md5(image_data, usedforsecurity=False).hexdigest()
 
             ext_map = {
                 "image/png": ".png",
@@ -515,12 +549,26 @@ class ENMLToXWikiConverter:
         except Exception:
             return None
 
-    def _get_unique_filename(self, filename: str) -> str:
-        """Get a unique filename, adding suffix if needed."""
+    def _get_unique_filename(self, filename: str, content_hash: str = "") -> str:
+        """Get a unique filename, adding a suffix if needed.
+
+        Collisions resolve with a short content-hash suffix (one or two
+        probes) rather than counting up through every existing name,
+        which degraded quadratically when many images shared a base name.
+        """
         if filename.lower() not in self.used_filenames:
             return filename
 
         base, ext = filename.rsplit(".", 1) if "." in filename else (filename, "")
+
+        if content_hash:
+            for hash_len in (8, 16):
+                suffix = content_hash[:hash_len]
+                new_name = f"{base}_{suffix}.{ext}" if ext else f"{base}_{suffix}"
+                if new_name.lower() not in self.used_filenames:
+                    return new_name
+
+        # No hash available (or full-hash collision): fall back to counting
         counter = 1
         while True:
             new_name = f"{base}_{counter}.{ext}" if ext else f"{base}_{counter}"
@@ -542,12 +590,12 @@ class ENMLToXWikiConverter:
                 self._process_element(child)
 
         # Write the table in XWiki format
-        self.output.write("\n")
+        self._emit("\n")
         for row in self.table_rows:
-            self.output.write("|")
-            self.output.write("|".join(row))
-            self.output.write("\n")
-        self.output.write("\n")
+            self._emit("|")
+            self._emit("|".join(row))
+            self._emit("\n")
+        self._emit("\n")
 
         self.in_table = False
         self.table_rows = []
@@ -578,10 +626,10 @@ class ENMLToXWikiConverter:
         text = self._get_element_text(element)
         lines = text.split("\n")
 
-        self.output.write("\n")
+        self._emit("\n")
         for line in lines:
-            self.output.write(f"> {line}\n")
-        self.output.write("\n")
+            self._emit(f"> {line}\n")
+        self._emit("\n")
 
     def _handle_code(self, element: etree._Element) -> None:
         """Handle code and pre elements."""
@@ -589,46 +637,103 @@ class ENMLToXWikiConverter:
 
         if element.tag.lower() == "pre" or "\n" in text:
             # Code block
-            self.output.write("\n{{code}}\n")
-            self.output.write(text)
-            self.output.write("\n{{/code}}\n")
+            self._emit("\n{{code}}\n")
+            self._emit(text)
+            self._emit("\n{{/code}}\n")
         else:
             # Inline code
-            self.output.write(f"###{text}###")
+            self._emit(f"###{text}###")
 
     def _handle_todo(self, element: etree._Element) -> None:
         """Handle Evernote todo checkboxes."""
         checked = element.get("checked", "false") == "true"
 
         if checked:
-            self.output.write("[x] ")
+            self._emit("[x] ")
         else:
-            self.output.write("[ ] ")
+            self._emit("[ ] ")
 
     def _handle_encrypted(self, element: etree._Element) -> None:
         """Handle encrypted content placeholder."""
-        self.output.write("\n{{warning}}\n")
-        self.output.write("This content was encrypted in Evernote and cannot be converted.\n")
-        self.output.write("{{/warning}}\n")
+        self._emit("\n{{warning}}\n")
+        self._emit("This content was encrypted in Evernote and cannot be converted.\n")
+        self._emit("{{/warning}}\n")
 
     def _get_element_text(self, element: etree._Element) -> str:
-        """Get all text content from an element and its children."""
-        texts = []
-        if element.text:
-            texts.append(unescape(element.text))
-
-        for child in element:
-            texts.append(self._get_element_text(child))
-            if child.tail:
-                texts.append(unescape(child.tail))
+        """Get all text content from an element and its children.
 
-        return "".join(texts)
+        itertext() walks the subtree in lxml's C code and yields text and
+        tails in the same document order the old Python recursion did.
+        """
+        return unescape("".join(element.itertext()))
 
     def _strip_html(self, html: str) -> str:
         """Strip HTML tags as a fallback."""
-        text = re.sub(r'<[^>]+>', '', html)
+        text = _RE_HTML_TAG.sub('', html)
         return unescape(text)
 
+    # Tag dispatch table, defined after the handlers it references. Every
+    # handler emits the element's own content only; _process_element writes
+    # the tail text uniformly.
+    _TAG_DISPATCH: dict[str, Callable] = {
+        # Inline formatting tags - handled specially to preserve text flow
+        "b": lambda self, el: self._handle_inline_format(el, "**", "**"),
+        "strong": lambda self, el: self._handle_inline_format(el, "**", "**"),
+        "i": lambda self, el: self._handle_inline_format(el, "//", "//"),
+        "em": lambda self, el: self._handle_inline_format(el, "//", "//"),
+        "u": lambda self, el: self._handle_inline_format(el, "__", "__"),
+        "s": lambda self, el: self._handle_inline_format(el, "--", "--"),
+        "strike": lambda self, el: self._handle_inline_format(el, "--", "--"),
+        "del": lambda self, el: self._handle_inline_format(el, "--", "--"),
+        "a": _handle_link,
+        "span": _handle_span,
+        "en-media": _handle_media,
+        "img": _handle_image,
+        "br": lambda self, el: self._emit("\n"),
+        "en-todo": _handle_todo,
+        # Block-level elements
+        "h1": lambda self, el: self._handle_heading(el, 1),
+        "h2": lambda self, el: self._handle_heading(el, 2),
+        "h3": lambda self, el: self._handle_heading(el, 3),
+        "h4": lambda self, el: self._handle_heading(el, 4),
+        "h5": lambda self, el: self._handle_heading(el, 5),
+        "h6": lambda self, el: self._handle_heading(el, 6),
+        "ul": lambda self, el: self._handle_list(el, ordered=False),
+        "ol": lambda self, el: self._handle_list(el, ordered=True),
+        "li": _handle_list_item,
+        "hr": lambda self, el: self._emit("\n----\n"),
+        "p": _handle_block,
+        "div": _handle_block,
+        "table": _handle_table,
+        "tr": _handle_table_row,
+        "td": lambda self, el: self._handle_table_cell(el, is_header=False),
+        "th": lambda self, el: self._handle_table_cell(el, is_header=True),
+        "blockquote": _handle_blockquote,
+        "code": _handle_code,
+        "pre": _handle_code,
+        "en-crypt": _handle_encrypted,
+    }
+
+
+def _derive_page_space(note: Note, space: str) -> str:
+    """Derive the XWiki space a note's page lands in."""
+    if note.notebook:
+        # Sanitize notebook name for use as subspace
+        notebook_space = note.notebook.replace(" ", "").replace("/", ".").replace("\\", ".")
+        return f"{space}.{notebook_space}"
+    return space
+
+
+def preview_page_identity(note: Note, space: str = "ImportedNotes") -> tuple[str, str]:
+    """Return the (space, page_name) convert_note would produce for a note.
+
+    Identity depends only on the title and notebook, so callers can run
+    skip-existing checks before paying for full ENML conversion.
+    """
+    page_space = _derive_page_space(note, space)
+    page_name = ConvertedPage(title=note.title, content="", space=page_space).page_name
+    return page_space, page_name
+
 
 def convert_note(note: Note, space: str = "ImportedNotes") -> ConvertedPage:
     """Convert an Evernote note to an XWiki page."""
@@ -649,12 +754,7 @@ def convert_note(note: Note, space: str = "ImportedNotes") -> ConvertedPage:
         content += "\n".join(metadata_parts)
 
     # Determine the space - always use the target space as the root
-    if note.notebook:
-        # Sanitize notebook name for use as subspace
-        notebook_space = note.notebook.replace(" ", "").replace("/", ".").replace("\\", ".")
-        page_space = f"{space}.{notebook_space}"
-    else:
-        page_space = space
+    page_space = _derive_page_space(note, space)
 
     # Combine original attachments with downloaded images
     all_attachments = note.attachments.copy()
@@ -1,6 +1,7 @@
 """SQLite database for tracking import history and status."""
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -55,12 +56,37 @@ class ImportSession:
     finished_at: datetime | None
 
 
+# Hot-path SQL used once per note. Keeping each statement as a single
+# constant string lets SQLite's per-connection statement cache reuse the
+# parsed statement instead of re-parsing on every call.
+_SQL_CREATE_RECORD = """
+    INSERT INTO import_records
+        (session_id, source_file, note_title, note_identifier,
+         wiki_url, target_space, attachments_count, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_RECORD_STATUS = """
+    UPDATE import_records
+    SET status = ?, page_url = ?, error_message = ?,
+        attachments_uploaded = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_SESSION_COUNTS = """
+    UPDATE import_sessions
+    SET completed_notes = ?, failed_notes = ?, skipped_notes = ?
+    WHERE id = ?
+"""
+
+
 class ImportDatabase:
     """SQLite database for tracking imports."""
 
     def __init__(self, db_path: Path | str = "evernote_imports.db"):
         """Initialize the database connection."""
         self.db_path = Path(db_path)
+        self._local = threading.local()
         self._init_db()
 
     def _init_db(self) -> None:
@@ -109,21 +135,41 @@ class ImportDatabase:
                     ON import_records(status);
                 CREATE INDEX IF NOT EXISTS idx_sessions_status
                     ON import_sessions(status);
+
+                -- Covering indexes for the hot lookups: the skip-existing
+                -- prefetch/check resolves entirely from the first, and the
+                -- history page's filtered record listing from the second.
+                CREATE INDEX IF NOT EXISTS idx_records_note_wiki
+                    ON import_records(note_identifier, wiki_url, status);
+                CREATE INDEX IF NOT EXISTS idx_records_session_status
+                    ON import_records(session_id, status);
+                CREATE INDEX IF NOT EXISTS idx_sessions_started
+                    ON import_sessions(started_at DESC);
             """)
 
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with context management."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get a database connection with context management.
+
+        One connection is kept open per thread and reused across calls,
+        so hot loops skip the per-call open/close and keep the statement
+        cache warm; commit/rollback semantics per call are unchanged.
+        Connections are cleaned up when their thread goes away.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            # WAL (set persistently in _init_db) + NORMAL synchronous avoids an
+            # fsync per commit; safe here since the history DB is crash-recoverable.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     # Session methods
 
@@ -168,11 +214,7 @@ class ImportDatabase:
         """Update session progress counts."""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                UPDATE import_sessions
-                SET completed_notes = ?, failed_notes = ?, skipped_notes = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_SESSION_COUNTS,
                 (completed, failed, skipped, session_id),
             )
 
@@ -202,6 +244,34 @@ class ImportDatabase:
 
             return [self._row_to_session(row) for row in rows]
 
+    def get_recent_session_summaries(
+        self, limit: int = 20
+    ) -> list[tuple[int, datetime, str]]:
+        """Get (id, started_at, status) for recent sessions.
+
+        The session-selector dropdowns only need these three columns, so
+        this skips fetching the full rows and building ImportSession
+        objects that get_recent_sessions pays for.
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, started_at, status FROM import_sessions
+                ORDER BY started_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+
+            return [
+                (
+                    row["id"],
+                    datetime.fromisoformat(row["started_at"]) if row["started_at"] else datetime.now(),
+                    row["status"],
+                )
+                for row in rows
+            ]
+
     def _row_to_session(self, row: sqlite3.Row) -> ImportSession:
         """Convert a database row to ImportSession."""
         return ImportSession(
@@ -233,12 +303,7 @@ class ImportDatabase:
         """Create a new import record."""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO import_records
-                    (session_id, source_file, note_title, note_identifier,
-                     wiki_url, target_space, attachments_count, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_CREATE_RECORD,
                 (
                     session_id,
                     source_file,
@@ -263,15 +328,56 @@ class ImportDatabase:
         """Update record status."""
         with self._get_connection() as conn:
             conn.execute(
-                """
-                UPDATE import_records
-                SET status = ?, page_url = ?, error_message = ?,
-                    attachments_uploaded = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_RECORD_STATUS,
                 (status.value, page_url, error_message, attachments_uploaded, record_id),
             )
 
+    def update_record_statuses(
+        self,
+        updates: list[tuple[int, ImportStatus, str | None, str | None, int]],
+    ) -> None:
+        """Apply many record status updates in a single transaction.
+
+        Each entry is (record_id, status, page_url, error_message,
+        attachments_uploaded). One executemany + commit replaces one
+        fsynced transaction per note.
+        """
+        if not updates:
+            return
+
+        rows = [
+            (status.value, page_url, error_message, attachments_uploaded, record_id)
+            for record_id, status, page_url, error_message, attachments_uploaded in updates
+        ]
+        with self._get_connection() as conn:
+            conn.executemany(_SQL_UPDATE_RECORD_STATUS, rows)
+
+    def flush_progress(
+        self,
+        session_id: int,
+        completed: int,
+        failed: int,
+        skipped: int,
+        updates: list[tuple[int, ImportStatus, str | None, str | None, int]],
+    ) -> None:
+        """Apply buffered record updates and session counters in one commit.
+
+        Import loops flush periodically; combining both writes halves the
+        fsynced transactions per flush compared to calling
+        update_record_statuses and update_session_counts separately.
+        """
+        with self._get_connection() as conn:
+            if updates:
+                rows = [
+                    (status.value, page_url, error_message, attachments_uploaded, record_id)
+                    for record_id, status, page_url, error_message, attachments_uploaded in updates
+                ]
+                conn.executemany(_SQL_UPDATE_RECORD_STATUS, rows)
+            conn.execute(
+                _SQL_UPDATE_SESSION_COUNTS,
+                (completed, failed, skipped, session_id),
+            )
+
     def get_record_by_identifier(self, note_identifier: str) -> ImportRecord | None:
         """Get a record by note identifier."""
         with self._get_connection() as conn:
@@ -358,6 +464,68 @@ class ImportDatabase:
 
             return [self._row_to_record(row) for row in rows]
 
+    def get_session_records_display(
+        self,
+        session_id: int,
+        status: ImportStatus | None = None,
+        source_file: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[sqlite3.Row]:
+        """Get display-ready columns for one page of the history table.
+
+        Title truncation, identifier shortening, the uploaded/total
+        attachment string and the time-of-day formatting all happen in
+        SQLite's C code, so callers can build their table straight from
+        the rows without materializing full ImportRecord objects. The
+        untruncated title and error_message come along for the error
+        detail expander.
+        """
+        with self._get_connection() as conn:
+            conditions = ["session_id = ?"]
+            params: list = [session_id]
+
+            if status:
+                conditions.append("status = ?")
+                params.append(status.value)
+
+            if source_file:
+                conditions.append("source_file = ?")
+                params.append(source_file)
+
+            where_clause = " AND ".join(conditions)
+            params.extend([limit, offset])
+
+            rows = conn.execute(
+                f"""
+                SELECT
+                    coalesce(source_file, '') AS source_file,
+                    CASE
+                        WHEN length(note_title) > 80
+                            THEN substr(note_title, 1, 80) || '...'
+                        ELSE coalesce(note_title, '')
+                    END AS title,
+                    CASE
+                        WHEN coalesce(note_identifier, '') = '' THEN '-'
+                        ELSE substr(note_identifier, 1, 8)
+                    END AS identifier,
+                    status,
+                    coalesce(page_url, '-') AS page_url,
+                    attachments_uploaded || '/' || attachments_count
+                        AS attachments,
+                    coalesce(strftime('%H:%M:%S', updated_at), '') AS updated,
+                    note_title,
+                    error_message
+                FROM import_records
+                WHERE {where_clause}
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                params,
+            ).fetchall()
+
+            return rows
+
     def get_all_records(
         self,
         status: ImportStatus | None = None,
@@ -402,37 +570,67 @@ class ImportDatabase:
 
             return row is not None
 
-    def get_stats(self) -> dict:
-        """Get overall import statistics."""
+    def get_imported_identifiers(self, wiki_url: str) -> set[str]:
+        """Get identifiers of all notes already imported to a specific wiki.
+
+        Fetching the full set once lets import loops do O(1) membership
+        tests instead of one query per note.
+        """
         with self._get_connection() as conn:
-            total = conn.execute(
-                "SELECT COUNT(*) FROM import_records"
-            ).fetchone()[0]
+            rows = conn.execute(
+                """
+                SELECT DISTINCT note_identifier FROM import_records
+                WHERE wiki_url = ? AND status = ?
+                """,
+                (wiki_url, ImportStatus.COMPLETED.value),
+            ).fetchall()
 
-            completed = conn.execute(
-                "SELECT COUNT(*) FROM import_records WHERE status = ?",
-                (ImportStatus.COMPLETED.value,),
-            ).fetchone()[0]
+            return {row["note_identifier"] for row in rows}
 
-            failed = conn.execute(
-                "SELECT COUNT(*) FROM import_records WHERE status = ?",
-                (ImportStatus.FAILED.value,),
-            ).fetchone()[0]
+    def get_session_counts(self, session_id: int) -> dict:
+        """Derive per-status counts for a session from its records.
 
-            skipped = conn.execute(
-                "SELECT COUNT(*) FROM import_records WHERE status = ?",
-                (ImportStatus.SKIPPED.value,),
-            ).fetchone()[0]
+        One GROUP BY over the (session_id, status) index; authoritative
+        even if the session row's denormalized counters are behind by a
+        flush interval.
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT status, COUNT(*) AS n
+                FROM import_records
+                WHERE session_id = ?
+                GROUP BY status
+                """,
+                (session_id,),
+            ).fetchall()
+
+            by_status = {row["status"]: row["n"] for row in rows}
+            return {
+                "total": sum(by_status.values()),
+                "completed": by_status.get(ImportStatus.COMPLETED.value, 0),
+                "failed": by_status.get(ImportStatus.FAILED.value, 0),
+                "skipped": by_status.get(ImportStatus.SKIPPED.value, 0),
+            }
+
+    def get_stats(self) -> dict:
+        """Get overall import statistics."""
+        with self._get_connection() as conn:
+            # One pass over the records table instead of four COUNT scans.
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM import_records GROUP BY status"
+            ).fetchall()
+            by_status = {row["status"]: row["n"] for row in rows}
 
             sessions = conn.execute(
                 "SELECT COUNT(*) FROM import_sessions"
             ).fetchone()[0]
 
             return {
-                "total_notes": total,
-                "completed": completed,
-                "failed": failed,
-                "skipped": skipped,
+                "total_notes": sum(by_status.values()),
+                "completed": by_status.get(ImportStatus.COMPLETED.value, 0),
+                "failed": by_status.get(ImportStatus.FAILED.value, 0),
+                "skipped": by_status.get(ImportStatus.SKIPPED.value, 0),
                 "total_sessions": sessions,
             }
 
@@ -2,6 +2,9 @@
 
 import base64
 import hashlib
+import mmap
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Iterator
@@ -124,26 +127,40 @@ def parse_note(note_elem: etree._Element) -> Note:
     )
 
 
+def _iter_note_elements(file_path: Path) -> Iterator[etree._Element]:
+    """Stream <note> elements from an ENEX file one at a time.
+
+    Uses iterparse so memory stays O(one note) instead of O(file size),
+    which matters for multi-gigabyte exports. Each yielded element is
+    cleared (and its already-parsed siblings dropped) after the caller
+    consumes it.
+    """
+    for _event, note_elem in etree.iterparse(
+        str(file_path), events=("end",), tag="note", huge_tree=True
+    ):
+        yield note_elem
+        # Free the element and any fully-parsed preceding siblings so the
+        # partially built tree does not accumulate.
+        note_elem.clear()
+        parent = note_elem.getparent()
+        while note_elem.getprevious() is not None:
+            del parent[0]
+
+
 def parse_enex_file(file_path: Path | str) -> Iterator[Note]:
     """
     Parse an ENEX file and yield Note objects.
 
-    Uses huge_tree parser to handle very large text nodes (e.g., base64 attachments).
+    Streams the file with iterparse (huge_tree for very large base64 text
+    nodes) so memory usage is bounded by the largest single note.
     """
     file_path = Path(file_path)
 
     if not file_path.exists():
         raise FileNotFoundError(f"ENEX file not found: {file_path}")
 
-    # Use huge_tree parser to handle very large text nodes
-    parser = etree.XMLParser(huge_tree=True)
-    tree = etree.parse(str(file_path), parser)
-    root = tree.getroot()
-
-    for note_elem in root.findall("note"):
+    for note_elem in _iter_note_elements(file_path):
         yield parse_note(note_elem)
-        # Clear the element to free memory after processing
-        note_elem.clear()
 
 
 def parse_enex_directory(directory: Path | str, recursive: bool = True) -> Iterator[tuple[Path, Note]]:
@@ -179,16 +196,25 @@ def parse_enex_directory(directory: Path | str, recursive: bool = True) -> Itera
             yield (enex_file, note)
 
 
+# Matches a <note> open tag (but not e.g. <note-attributes>) in raw bytes.
+_NOTE_OPEN_TAG = re.compile(rb"<note[\s>]")
+
+
 def count_notes_in_enex(file_path: Path | str) -> int:
-    """Count the number of notes in an ENEX file without fully parsing."""
-    file_path = Path(file_path)
+    """Count the number of notes in an ENEX file without fully parsing.
 
-    # Use huge_tree parser to handle very large text nodes
-    parser = etree.XMLParser(huge_tree=True)
-    tree = etree.parse(str(file_path), parser)
-    root = tree.getroot()
+    The count is only used to size progress bars, so a byte-level scan of
+    the memory-mapped file is sufficient and avoids XML tokenization
+    entirely. Falls back to streaming parse if the file cannot be mapped
+    (e.g. it is empty).
+    """
+    file_path = Path(file_path)
 
-    return len(root.findall("note"))
+    try:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return sum(1 for _ in _NOTE_OPEN_TAG.finditer(mm))
+    except (OSError, ValueError):
+        return sum(1 for _ in _iter_note_elements(file_path))
 
 
 def get_note_summaries_from_enex(file_path: Path | str) -> list[dict]:
@@ -205,12 +231,8 @@ def get_note_summaries_from_enex(file_path: Path | str) -> list[dict]:
     if not file_path.exists():
         raise FileNotFoundError(f"ENEX file not found: {file_path}")
 
-    parser = etree.XMLParser(huge_tree=True)
-    tree = etree.parse(str(file_path), parser)
-    root = tree.getroot()
-
     summaries = []
-    for note_elem in root.findall("note"):
+    for note_elem in _iter_note_elements(file_path):
         title_elem = note_elem.find("title")
         title = title_elem.text if title_elem is not None and title_elem.text else "Untitled"
 
@@ -218,7 +240,6 @@ def get_note_summaries_from_enex(file_path: Path | str) -> list[dict]:
         created = parse_enex_datetime(created_elem.text) if created_elem is not None and created_elem.text else None
 
         summaries.append({"title": title, "created": created})
-        note_elem.clear()
 
     return summaries
 
@@ -244,10 +265,18 @@ def build_enex_inventory(source_path: Path | str) -> tuple[dict[str, list[dict]]
         inventory[str(source)] = summaries
         grand_total = len(summaries)
     elif source.is_dir():
-        for enex_file in sorted(source.rglob("*.enex"), key=lambda p: str(p).casefold()):
-            summaries = get_note_summaries_from_enex(enex_file)
-            inventory[str(enex_file)] = summaries
-            grand_total += len(summaries)
+        # Parse files in parallel: iterparse releases the GIL while lxml
+        # reads, so directories of many ENEX files scan roughly
+        # #threads-times faster. Ordering is preserved by mapping over the
+        # sorted list.
+        enex_files = sorted(source.rglob("*.enex"), key=lambda p: str(p).casefold())
+        if enex_files:
+            with ThreadPoolExecutor(max_workers=min(16, len(enex_files))) as pool:
+                for enex_file, summaries in zip(
+                    enex_files, pool.map(get_note_summaries_from_enex, enex_files)
+                ):
+                    inventory[str(enex_file)] = summaries
+                    grand_total += len(summaries)
     else:
         raise ValueError(f"Source path is not an ENEX file or directory: {source}")
 
@@ -55,6 +55,16 @@ class EvernoteNotebook:
     stack: str | None = None
 
 
+@dataclass
+class EvernoteNoteMeta:
+    """Lightweight note metadata, without content or attachments."""
+
+    guid: str
+    title: str
+    created: datetime | None = None
+    tag_guids: list[str] | None = None
+
+
 class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler to receive OAuth callback."""
 
@@ -271,26 +281,15 @@ class EvernoteClient:
         self._load_tags()
         return [self._tags_cache.get(guid, "") for guid in tag_guids if guid in self._tags_cache]
 
-    def get_notes_from_notebook(
-        self,
-        notebook_guid: str,
-        notebook_name: str = "",
-        progress_callback: Callable[[int, int, str], None] | None = None,
-    ) -> Iterator[Note]:
-        """
-        Download all notes from a notebook.
+    def list_note_metadata(self, notebook_guid: str) -> list[EvernoteNoteMeta]:
+        """List note metadata for a notebook without downloading content.
 
-        Args:
-            notebook_guid: GUID of the notebook
-            notebook_name: Name of the notebook (for setting note.notebook)
-            progress_callback: Optional callback(current, total, note_title)
-
-        Yields:
-            Note objects
+        Only title, created timestamp and tag GUIDs come back from
+        findNotesMetadata, so callers can run skip checks (which key on
+        title + created) before paying for any full note download.
         """
         from evernote.edam.notestore.ttypes import NoteFilter, NotesMetadataResultSpec
 
-        # Set up filter for this notebook
         note_filter = NoteFilter(notebookGuid=notebook_guid)
         result_spec = NotesMetadataResultSpec(
             includeTitle=True,
@@ -299,7 +298,7 @@ class EvernoteClient:
             includeTagGuids=True,
         )
 
-        # Get total count first
+        metas: list[EvernoteNoteMeta] = []
         offset = 0
         page_size = 100
 
@@ -310,42 +309,72 @@ class EvernoteClient:
             total_notes = metadata.totalNotes
         except Exception as e:
             print(f"Error getting note count: {e}")
-            return
+            return metas
 
-        # Iterate through all notes
-        processed = 0
         while offset < total_notes:
             try:
                 metadata = self.note_store.findNotesMetadata(
                     note_filter, offset, page_size, result_spec
                 )
+            except Exception as e:
+                print(f"Error fetching notes: {e}")
+                break
+
+            for note_meta in metadata.notes:
+                created = None
+                if note_meta.created:
+                    created = datetime.fromtimestamp(note_meta.created / 1000)
 
-                for note_meta in metadata.notes:
-                    try:
-                        # Get the full note with content and resources
-                        note = self._download_note(note_meta.guid)
-                        if note:
-                            note.notebook = notebook_name
+                metas.append(EvernoteNoteMeta(
+                    guid=note_meta.guid,
+                    title=note_meta.title or "Untitled",
+                    created=created,
+                    tag_guids=note_meta.tagGuids,
+                ))
 
-                            # Add tags
-                            note.tags = self._get_tag_names(note_meta.tagGuids)
+            offset += page_size
 
-                            processed += 1
-                            if progress_callback:
-                                progress_callback(processed, total_notes, note.title)
+        return metas
 
-                            yield note
+    def get_note(self, meta: EvernoteNoteMeta, notebook_name: str = "") -> Note | None:
+        """Download the full note for previously listed metadata."""
+        note = self._download_note(meta.guid)
+        if note:
+            note.notebook = notebook_name
+            note.tags = self._get_tag_names(meta.tag_guids)
+        return note
 
-                    except Exception as e:
-                        print(f"Error downloading note {note_meta.title}: {e}")
-                        processed += 1
-                        continue
+    def get_notes_from_notebook(
+        self,
+        notebook_guid: str,
+        notebook_name: str = "",
+        progress_callback: Callable[[int, int, str], None] | None = None,
+    ) -> Iterator[Note]:
+        """
+        Download all notes from a notebook.
 
-                offset += page_size
+        Args:
+            notebook_guid: GUID of the notebook
+            notebook_name: Name of the notebook (for setting note.notebook)
+            progress_callback: Optional callback(current, total, note_title)
 
+        Yields:
+            Note objects
+        """
+        metas = self.list_note_metadata(notebook_guid)
+        total_notes = len(metas)
+
+        for processed, meta in enumerate(metas, 1):
+            try:
+                note = self.get_note(meta, notebook_name)
             except Exception as e:
-                print(f"Error fetching notes: {e}")
-                break
+                print(f"Error downloading note {meta.title}: {e}")
+                continue
+
+            if note:
+                if progress_callback:
+                    progress_callback(processed, total_notes, note.title)
+                yield note
 
     def _download_note(self, note_guid: str) -> Note | None:
         """Download a single note with all its content and attachments."""
@@ -440,37 +469,37 @@ class EvernoteClient:
             return None
 
 
+# Default token location, computed once at import.
+_DEFAULT_TOKEN_PATH = Path.home() / ".evernote_extractor" / "evernote_token.json"
+
+
 def save_token(token: str, path: Path | None = None) -> None:
     """Save access token to file."""
     if path is None:
-        path = Path.home() / ".evernote_extractor" / "evernote_token.json"
+        path = _DEFAULT_TOKEN_PATH
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w") as f:
-        json.dump({"access_token": token}, f)
+    path.write_bytes(json.dumps({"access_token": token}).encode())
 
 
 def load_token(path: Path | None = None) -> str | None:
     """Load access token from file."""
     if path is None:
-        path = Path.home() / ".evernote_extractor" / "evernote_token.json"
-
-    if not path.exists():
-        return None
+        path = _DEFAULT_TOKEN_PATH
 
     try:
-        with open(path) as f:
-            data = json.load(f)
-            return data.get("access_token")
-    except (json.JSONDecodeError, IOError):
+        # One bytes read instead of a text-mode handle + incremental decode.
+        data = json.loads(path.read_bytes())
+        return data.get("access_token")
+    except (json.JSONDecodeError, OSError):
         return None
 
 
 def delete_token(path: Path | None = None) -> None:
     """Delete saved access token."""
     if path is None:
-        path = Path.home() / ".evernote_extractor" / "evernote_token.json"
+        path = _DEFAULT_TOKEN_PATH
 
     if path.exists():
         path.unlink()
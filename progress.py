@@ -2,12 +2,16 @@
 
 import hashlib
 import json
+import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+# Bound once so the hot loop skips the hashlib attribute lookup per note.
+_sha256 = hashlib.sha256
+
 
 class NoteStatus(str, Enum):
     """Status of a note in the import process."""
@@ -91,6 +95,7 @@ class ProgressTracker:
             self.state_file = Path(state_file)
 
         self.progress = ImportProgress()
+        self._dirty = False
 
     def load(self) -> bool:
         """
@@ -134,7 +139,12 @@ class ProgressTracker:
             return False
 
     def save(self) -> None:
-        """Save progress to state file."""
+        """Write progress to the state file atomically.
+
+        The JSON goes to a sibling temp file first and is moved into place
+        with os.replace, so a crash mid-write never leaves a truncated
+        state file behind.
+        """
         self.progress.last_updated = datetime.now().isoformat()
 
         data: dict[str, Any] = {
@@ -157,12 +167,27 @@ class ProgressTracker:
                 "source_file": note_progress.source_file,
             }
 
-        with open(self.state_file, "w") as f:
+        tmp_path = self.state_file.with_name(self.state_file.name + ".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.state_file)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Persist any pending in-memory changes.
+
+        The mark_* methods only mutate memory and set a dirty flag, so a
+        large import rewrites the state file once per batch (see the CLI's
+        flush interval) instead of once per note. Safe to call repeatedly;
+        does nothing when nothing changed.
+        """
+        if self._dirty:
+            self.save()
 
     def reset(self) -> None:
         """Reset progress and delete state file."""
         self.progress = ImportProgress()
+        self._dirty = False
         if self.state_file.exists():
             self.state_file.unlink()
 
@@ -186,6 +211,7 @@ class ProgressTracker:
                 title=title,
                 source_file=source_file,
             )
+            self._dirty = True
 
     def mark_uploaded(
         self,
@@ -198,7 +224,7 @@ class ProgressTracker:
             note.status = NoteStatus.UPLOADED
             note.page_url = page_url
             note.uploaded_at = datetime.now().isoformat()
-            self.save()
+            self._dirty = True
 
     def mark_failed(self, identifier: str, error: str) -> None:
         """Mark a note as failed."""
@@ -206,7 +232,7 @@ class ProgressTracker:
             note = self.progress.notes[identifier]
             note.status = NoteStatus.FAILED
             note.error = error
-            self.save()
+            self._dirty = True
 
     def mark_skipped(self, identifier: str, reason: str = "Already exists") -> None:
         """Mark a note as skipped."""
@@ -214,7 +240,7 @@ class ProgressTracker:
             note = self.progress.notes[identifier]
             note.status = NoteStatus.SKIPPED
             note.error = reason
-            self.save()
+            self._dirty = True
 
     def is_processed(self, identifier: str) -> bool:
         """Check if a note has already been processed (uploaded or skipped)."""
@@ -237,11 +263,18 @@ class ProgressTracker:
 
 
 def generate_note_identifier(title: str, created: datetime | None) -> str:
-    """Generate a unique identifier for a note."""
+    """Generate a unique identifier for a note.
+
+    The algorithm must stay sha256: identifiers are persisted in the
+    import database and progress files, so changing the hash would make
+    every previously imported note look new to skip-existing checks and
+    to reconciliation. sha256 is not on the wall-time-critical path
+    anyway — hashing a short title string is microseconds per note.
+    """
     if created:
         key = f"{title}_{created.isoformat()}"
     else:
         key = title
 
     # Use a hash to ensure a valid identifier
-    return hashlib.sha256(key.encode()).hexdigest()[:16]
+    return _sha256(key.encode()).hexdigest()[:16]
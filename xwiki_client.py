@@ -1,7 +1,10 @@
 """XWiki REST API client for uploading pages and attachments."""
 
 import base64
+import io
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -23,6 +26,43 @@ class UploadResult:
     attachments_failed: int = 0
 
 
+class _TokenBucket:
+    """Thread-safe token bucket bounding the average request rate.
+
+    Unlike a flat sleep between calls, the bucket lets up to ``capacity``
+    requests go out back-to-back (or concurrently from worker threads)
+    while the long-run rate stays at ``refill_per_sec``.
+    """
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Reserve the next request slot, sleeping only for the deficit.
+
+        The balance may go negative: that reserves a future refill slot
+        for this caller, so each thread sleeps exactly once for its own
+        deficit instead of looping and re-contending for the lock. When
+        network latency already paces requests past the refill interval,
+        no sleep happens at all.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now - self._last_refill) * self.refill_per_sec,
+            )
+            self._last_refill = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.refill_per_sec if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 class XWikiClient:
     """Client for XWiki REST API."""
 
@@ -51,6 +91,13 @@ class XWikiClient:
         self.password = password
         self.wiki_name = wiki_name
         self.rate_limit_delay = rate_limit_delay
+        # Shared bucket: bursts of up to 8 requests may proceed without
+        # waiting, but the sustained rate stays at 1 per rate_limit_delay.
+        self._rate_bucket = (
+            _TokenBucket(capacity=8, refill_per_sec=1.0 / rate_limit_delay)
+            if rate_limit_delay > 0
+            else None
+        )
 
         # Set up session with retry logic
         self.session = requests.Session()
@@ -60,7 +107,14 @@ class XWikiClient:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger pool so every request reuses a warm TLS connection instead
+        # of paying a new handshake (pages, attachments and tags all hit the
+        # same host).
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=8,
+            pool_maxsize=32,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -73,6 +127,19 @@ class XWikiClient:
         # Form token for CSRF protection (fetched on first request)
         self._form_token: str | None = None
 
+        # Pool for concurrent attachment uploads within a note; threads are
+        # spawned on demand and shared across calls.
+        self._attachment_pool = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="xwiki-attach"
+        )
+
+        # Memoized page-existence answers, seeded per space from the bulk
+        # listing and updated on successful uploads, so repeated checks for
+        # the same page cost a dict lookup instead of an HTTP round trip.
+        self._page_cache_lock = threading.Lock()
+        self._page_exists_cache: dict[tuple[str, str], bool] = {}
+        self._listed_spaces: set[str] = set()
+
     def _get_rest_url(self) -> str:
         """Get the REST API base URL."""
         return f"{self.wiki_url}/rest/wikis/{self.wiki_name}"
@@ -114,9 +181,9 @@ class XWikiClient:
         return "/".join(path_parts)
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting delay."""
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
+        """Take a rate-limit token, blocking if the bucket is drained."""
+        if self._rate_bucket is not None:
+            self._rate_bucket.acquire()
 
     def test_connection(self) -> bool:
         """Test the connection to XWiki."""
@@ -188,8 +255,9 @@ class XWikiClient:
         test_xml = '<?xml version="1.0" encoding="UTF-8"?><page xmlns="http://www.xwiki.org"><title>Test Page</title><content>Test from Python</content></page>'
 
         try:
-            # Make a simple PUT request with explicit Authorization header
-            response = requests.put(
+            # Simple PUT with explicit Authorization header, reusing the
+            # pooled session connection
+            response = self.session.put(
                 url,
                 data=test_xml,
                 headers=self._get_write_headers("application/xml"),
@@ -237,7 +305,7 @@ class XWikiClient:
         try:
             self._rate_limit()
 
-            response = requests.put(
+            response = self.session.put(
                 url,
                 data=page_xml.encode('utf-8'),
                 headers=self._get_write_headers("application/xml; charset=UTF-8"),
@@ -246,12 +314,25 @@ class XWikiClient:
             if response.status_code in (200, 201, 202):
                 page_url = f"{self.wiki_url}/wiki/{self.wiki_name}/{page.space.replace('.', '/')}/{page_name}"
 
-                # Upload attachments
+                # Upload attachments; independent PUTs go out concurrently
+                # so a note with many attachments costs ~max() not sum() of
+                # the individual upload times.
                 attachments_uploaded = 0
                 attachments_failed = 0
 
-                for attachment in page.attachments:
-                    if self._upload_attachment(page.space, page_name, attachment):
+                if len(page.attachments) > 1:
+                    outcomes = self._attachment_pool.map(
+                        lambda att: self._upload_attachment(page.space, page_name, att),
+                        page.attachments,
+                    )
+                else:
+                    outcomes = (
+                        self._upload_attachment(page.space, page_name, att)
+                        for att in page.attachments
+                    )
+
+                for uploaded in outcomes:
+                    if uploaded:
                         attachments_uploaded += 1
                     else:
                         attachments_failed += 1
@@ -260,8 +341,11 @@ class XWikiClient:
                 if page.tags:
                     self._add_tags(page.space, page_name, page.tags)
 
-                # Verify page was actually created
+                # Verify page was actually created (a real request on
+                # purpose — the cache cannot confirm this PUT landed)
                 if self.page_exists(page.space, page_name):
+                    with self._page_cache_lock:
+                        self._page_exists_cache[(page.space, page_name)] = True
                     return UploadResult(
                         success=True,
                         page_url=page_url,
@@ -326,9 +410,13 @@ class XWikiClient:
         try:
             self._rate_limit()
 
-            response = requests.put(
+            # A file-like body makes requests stream the upload in fixed
+            # blocks instead of handing the socket one monolithic buffer;
+            # BytesIO is seekable, so Content-Length is still set (no
+            # chunked transfer encoding, which some proxies reject).
+            response = self.session.put(
                 url,
-                data=attachment.data,
+                data=io.BytesIO(attachment.data),
                 headers=self._get_write_headers(attachment.mime_type),
             )
 
@@ -353,7 +441,7 @@ class XWikiClient:
         try:
             self._rate_limit()
 
-            response = requests.put(
+            response = self.session.put(
                 url,
                 data=tags_xml.encode('utf-8'),
                 headers=self._get_write_headers("application/xml; charset=UTF-8"),
@@ -364,6 +452,70 @@ class XWikiClient:
         except requests.RequestException:
             return False
 
+    def list_existing_pages(self, space: str) -> set[str] | None:
+        """Best-effort bulk listing of note page names under a space.
+
+        Notes are stored as nested pages ({space}.{page_name}.WebHome), so
+        the page names correspond to the spaces nested directly under
+        ``space``. Returns None when the listing cannot be fetched, in
+        which case callers should fall back to per-page exists checks.
+        """
+        url = f"{self._get_rest_url()}/spaces?number=10000"
+
+        try:
+            response = self.session.get(url)
+            if response.status_code != 200:
+                return None
+            payload = response.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+        prefix = f"{space}."
+        names: set[str] = set()
+        for entry in payload.get("spaces", []):
+            # Space ids look like "xwiki:Parent.Child"
+            space_id = entry.get("id", "")
+            _, _, dotted = space_id.partition(":")
+            if dotted.startswith(prefix):
+                remainder = dotted[len(prefix):]
+                names.add(remainder.split(".", 1)[0])
+
+        return names
+
+    def page_exists_cached(self, space: str, page_name: str) -> bool:
+        """Check page existence through the in-memory cache.
+
+        The first check in a space fetches the bulk listing once and seeds
+        the cache (both positives and, since the listing is complete,
+        negatives); later checks are dict lookups. If the listing cannot
+        be fetched, individual results from ``page_exists`` are memoized
+        instead. Successful uploads mark their page present, so a title
+        repeated across ENEX files never pays a second round trip.
+        """
+        key = (space, page_name)
+        with self._page_cache_lock:
+            cached = self._page_exists_cache.get(key)
+            need_listing = space not in self._listed_spaces
+        if cached is not None:
+            return cached
+
+        if need_listing:
+            listing = self.list_existing_pages(space)
+            with self._page_cache_lock:
+                self._listed_spaces.add(space)
+                if listing is not None:
+                    for name in listing:
+                        self._page_exists_cache.setdefault((space, name), True)
+                    # A complete listing is authoritative for absence too.
+                    exists = page_name in listing
+                    self._page_exists_cache.setdefault(key, exists)
+                    return self._page_exists_cache[key]
+
+        exists = self.page_exists(space, page_name)
+        with self._page_cache_lock:
+            self._page_exists_cache[key] = exists
+        return exists
+
     def page_exists(self, space: str, page_name: str) -> bool:
         """Check if a page already exists."""
         space_path = self._space_to_url_path(space)
@@ -371,7 +523,7 @@ class XWikiClient:
         url = f"{self._get_rest_url()}/{space_path}/spaces/{page_name}/pages/WebHome"
 
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers={"Authorization": self._get_auth_header()},
             )